@@ -4,16 +4,30 @@ Q-Cleaner Web Panel for macOS
 A web-based cache and temp file cleaner with system monitoring
 """
 
+import copy
+import ctypes
+import heapq
 import os
-import shutil
+import plistlib
+import re
+import resource
+import stat
+import struct
 import subprocess
+import sys
+import itertools
 import json
+import mmap
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
-from flask import Flask, render_template, jsonify, request, send_from_directory
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from flask import Flask, Response, render_template, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 import webbrowser
 import socket
 
@@ -25,23 +39,215 @@ except ImportError:
     print("Warning: psutil not installed. System monitoring will be limited.")
     print("Install with: pip install psutil")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
 app = Flask(__name__)
 
+# dataclass(slots=True) needs Python 3.10; older interpreters get plain classes
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _json_default(obj):
+    # Slotted dataclasses provide a flat to_dict(), cheaper than asdict()
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    return DefaultJSONProvider.default(obj)
+
+
+def encode_json(data) -> bytes:
+    """Encode data to JSON bytes, with orjson when it is installed.
+
+    orjson serializes dataclasses natively, so result lists can be passed
+    as-is without converting each item to a dict first.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, default=_json_default, separators=(',', ':')).encode('utf-8')
+
+
+def ojson(data) -> Response:
+    """Build a JSON response, encoding with orjson when it is installed."""
+    return app.response_class(encode_json(data), mimetype='application/json')
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class ScanSnapshot:
+    """Immutable view of scan progress.
+
+    The scanner publishes a new snapshot on every update by rebinding
+    ScanState.progress, so request handlers can read a consistent view
+    without taking a lock.
+    """
+    current: int = 0
+    total: int = 0
+    percent: int = 0
+    current_location: str = ""
+    found_count: int = 0
+    total_size: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "current": self.current,
+            "total": self.total,
+            "percent": self.percent,
+            "current_location": self.current_location,
+            "found_count": self.found_count,
+            "total_size": self.total_size,
+        }
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ScanState:
+    """Results and progress of one kind of scan; writers hold `lock` and bump `version`."""
+    results: list = field(default_factory=list)
+    # Results are fixed between scans, so they are encoded once when a scan finishes
+    results_json: bytes = b"[]"
+    # id -> results with that id; ids are not guaranteed unique across containers
+    by_id: Dict[str, list] = field(default_factory=dict)
+    in_progress: bool = False
+    # Set once a scan has published its results; cleared when the next one starts
+    done: threading.Event = field(default_factory=threading.Event)
+    progress: ScanSnapshot = field(default_factory=ScanSnapshot)
+    version: int = 0
+    lock: threading.Condition = field(default_factory=threading.Condition)
+
+    def try_start(self, progress: ScanSnapshot) -> bool:
+        """Mark a new scan as running; False if one already is."""
+        with self.lock:
+            if self.in_progress:
+                return False
+            self.in_progress = True
+            self.done.clear()
+            self.results = []
+            self.results_json = b"[]"
+            self.by_id = {}
+            self.progress = progress
+            self._changed()
+            return True
+
+    def update(self, **changes):
+        with self.lock:
+            self.progress = replace(self.progress, **changes)
+            self._changed()
+
+    def add_found(self, size: int):
+        """Count one more result of `size` bytes."""
+        with self.lock:
+            self.progress = replace(
+                self.progress,
+                found_count=self.progress.found_count + 1,
+                total_size=self.progress.total_size + size
+            )
+            self._changed()
+
+    def finish(self, results: list):
+        results_json = encode_json(results)
+        by_id = {}
+        for result in results:
+            by_id.setdefault(result.id, []).append(result)
+        with self.lock:
+            self.results = results
+            self.results_json = results_json
+            self.by_id = by_id
+            self.in_progress = False
+            self.done.set()
+            self._changed()
+
+    def _changed(self):
+        # Caller holds the lock
+        self.version += 1
+        self.lock.notify_all()
+
+    def wait_for_change(self, seen_version: int, timeout: float) -> int:
+        """Block until version moves past seen_version (or timeout); return it."""
+        with self.lock:
+            self.lock.wait_for(lambda: self.version != seen_version, timeout)
+            return self.version
+
+    def status(self) -> Dict[str, Any]:
+        with self.lock:
+            progress = self.progress
+            return {
+                "in_progress": self.in_progress,
+                "complete": self.done.is_set(),
+                "count": len(self.results),
+                "current_location": progress.current_location,
+                "progress": progress.to_dict()
+            }
+
+
 # Global state
-scan_results = []
-scan_in_progress = False
-scan_complete = False
-scan_progress = {
-    "current": 0,
-    "total": 0,
-    "percent": 0,
-    "current_location": "",
-    "found_count": 0,
-    "total_size": 0
-}
-
-
-@dataclass
+scan_state = ScanState()
+
+
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Read a positive integer setting from the environment."""
+    try:
+        return max(minimum, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+# Number of cache locations sized concurrently during a scan; override it
+# with QCLEANER_SCAN_THREADS (spinning disks are already capped, see below)
+SCAN_WORKERS = _env_int('QCLEANER_SCAN_THREADS', 8)
+# Container caches are many small trees on one volume; APFS directory
+# reads stop scaling past about four concurrent walkers
+CONTAINER_CACHE_WORKERS = 4
+# Locations or leftovers deleted concurrently by a clean request. On APFS,
+# parallel deletes in one volume contend on the same directory locks, so
+# there each volume gets a single deleting thread.
+CLEAN_WORKERS = 4
+CLEAN_WORKERS_PER_VOLUME = 1 if sys.platform == 'darwin' else CLEAN_WORKERS
+# Leftover detectors run at once; they all read the same Library volume
+LEFTOVER_WORKERS = 4
+
+# On a spinning disk parallel walks just make the head seek between trees,
+# so pools walking one are cut to a single thread. Keyed by st_dev, since
+# diskutil is a fork and the answer never changes while we run.
+_rotational_devices = {}
+_rotational_lock = threading.Lock()
+
+
+def on_rotational_disk(path: str, dev: int = None) -> bool:
+    """True if path lives on a spinning disk; False on SSDs or when unknown."""
+    if sys.platform != 'darwin':
+        return False
+    try:
+        if dev is None:
+            dev = os.stat(path).st_dev
+    except OSError:
+        return False
+    with _rotational_lock:
+        if dev in _rotational_devices:
+            return _rotational_devices[dev]
+    try:
+        result = subprocess.run(['diskutil', 'info', '-plist', path],
+                                capture_output=True, timeout=5)
+        rotational = plistlib.loads(result.stdout).get('SolidState') is False
+    except (OSError, subprocess.SubprocessError, plistlib.InvalidFileException, ValueError):
+        rotational = False
+    with _rotational_lock:
+        _rotational_devices[dev] = rotational
+    return rotational
+
+
+def walk_workers(path: str, workers: int) -> int:
+    """Pool size for walking trees on path's volume."""
+    return 1 if on_rotational_disk(path) else workers
+
+
+@dataclass(**DATACLASS_SLOTS)
 class CacheLocation:
     id: str
     path: str
@@ -55,11 +261,32 @@ class CacheLocation:
     size_human: str = "0B"
     selected: bool = False
     exists: bool = False
+    partial: bool = False  # size walk hit its time budget; size is a lower bound
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "path": self.path,
+            "name": self.name,
+            "description": self.description,
+            "category": self.category,
+            "hint": self.hint,
+            "impact": self.impact,
+            "risk": self.risk,
+            "size": self.size,
+            "size_human": self.size_human,
+            "selected": self.selected,
+            "exists": self.exists,
+            "partial": self.partial,
+        }
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class LeftoverItem:
-    """Represents a leftover file/folder from an uninstalled application."""
+    """Represents a leftover file/folder from an uninstalled application.
+
+    Items are never modified after a detector yields them.
+    """
     id: str
     path: str
     name: str                  # App name (inferred or from receipt)
@@ -72,51 +299,336 @@ class LeftoverItem:
     size_human: str = "0B"
     selected: bool = False
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "path": self.path,
+            "name": self.name,
+            "bundle_id": self.bundle_id,
+            "detection_source": self.detection_source,
+            "category": self.category,
+            "confidence": self.confidence,
+            "hint": self.hint,
+            "size": self.size,
+            "size_human": self.size_human,
+            "selected": self.selected,
+        }
+
+
+O_DIRECTORY = getattr(os, 'O_DIRECTORY', 0)
+O_NOFOLLOW = getattr(os, 'O_NOFOLLOW', 0)
+
+# Every concurrent walk holds one descriptor per directory level, which can
+# outgrow macOS's default soft limit of 256; OPEN_MAX caps what it accepts
+OPEN_FILES_TARGET = 10240
+
+
+def raise_open_file_limit():
+    """Lift the soft RLIMIT_NOFILE towards the hard limit, once at startup."""
+    try:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        target = OPEN_FILES_TARGET if hard == resource.RLIM_INFINITY else min(hard, OPEN_FILES_TARGET)
+        if soft != resource.RLIM_INFINITY and soft < target:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+    except (ValueError, OSError):
+        pass
+
+
+raise_open_file_limit()
+
+# Seconds a single size walk may take before it reports a partial size
+SIZE_WALK_TIME_BUDGET = 30.0
+# Volume metadata folders that are never cache contents; size walks skip
+# them, along with anything mounted on another device (like `du -x`)
+WALK_SKIP_NAMES = frozenset({
+    '.Spotlight-V100', '.fseventsd', '.DocumentRevisions-V100',
+    '.Trashes', '.TemporaryItems',
+})
+# Extra threads that help walk the top-level subdirectories of one big tree
+SUBTREE_WALK_WORKERS = 4
+_SUBTREE_POOL = ThreadPoolExecutor(max_workers=SUBTREE_WALK_WORKERS)
+
+
+# Resolved once; the home directory does not change while the panel runs
+HOME = os.path.expanduser('~')
+
 
 def get_home() -> str:
-    return str(Path.home())
+    return HOME
+
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
+@lru_cache(maxsize=4096)
 def human_readable_size(size_bytes: int) -> str:
-    if size_bytes < 0:
+    if size_bytes <= 0:
         return "0 B"
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if abs(size_bytes) < 1024.0:
-            if unit == 'B':
-                return f"{size_bytes} {unit}"
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    size_bytes = int(size_bytes)
+    # Each unit is 2**10 larger, so the bit length selects it directly
+    unit_idx = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    if unit_idx == 0:
+        return f"{size_bytes} B"
+    return f"{size_bytes / (1 << (unit_idx * 10)):.1f} {SIZE_UNITS[unit_idx]}"
 
 
-def get_directory_size(path: str) -> int:
+# ============================================================================
+# DIRECTORY SIZE
+# ============================================================================
+
+def _shallow_size(path: str) -> int:
+    """Sum the disk usage of the regular files directly inside path.
+
+    Like every size here this is allocated blocks of regular files only,
+    which is close to but not `du`: directories' own blocks are left out
+    and a hard-linked file counts once per link.
+    """
+    total_size = 0
     try:
-        result = subprocess.run(
-            ['du', '-sk', path],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode == 0:
-            size_kb = int(result.stdout.split()[0])
-            return size_kb * 1024
-    except:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    total_size += st.st_blocks * 512
+    except OSError:
         pass
-    
+    return total_size
+
+
+def _walk_size(path: str, exclude=frozenset(), deadline: float = None) -> Tuple[int, bool]:
+    """Return (disk usage below path, partial); top-level subdirectories are walked in parallel."""
+    try:
+        fd = os.open(path, os.O_RDONLY | O_DIRECTORY)
+    except OSError:
+        return 0, False
+    try:
+        st = os.fstat(fd)
+        root_dev = st.st_dev
+        buf = ctypes.create_string_buffer(BULKSTAT_BUFFER_SIZE) if _load_bulkstat() else None
+        total_size, names = _list_directory(fd, root_dev, buf)
+    except OSError:
+        return 0, False
+    finally:
+        os.close(fd)
+    subdirs = [subdir for subdir in (os.path.join(path, name) for name in names)
+               if subdir not in exclude]
+
+    if len(subdirs) < 2 or on_rotational_disk(path, root_dev):
+        walks = [(subdir, None) for subdir in subdirs]
+    else:
+        walks = [(subdir, _SUBTREE_POOL.submit(_walk_tree_size, subdir, root_dev, exclude, deadline))
+                 for subdir in subdirs]
+    partial = False
+    for subdir, future in walks:
+        if future is None or future.cancel():
+            size, cut_short = _walk_tree_size(subdir, root_dev, exclude, deadline)
+        else:
+            size, cut_short = future.result()
+        total_size += size
+        partial = partial or cut_short
+    return total_size, partial
+
+
+def _walk_tree_size(path: str, root_dev: int, exclude=frozenset(), deadline: float = None) -> Tuple[int, bool]:
+    """Serial half of _walk_size: walk one subtree, staying on device root_dev."""
+    try:
+        fd = os.open(path, os.O_RDONLY | O_DIRECTORY | O_NOFOLLOW)
+    except OSError:
+        return 0, False
+    buf = ctypes.create_string_buffer(BULKSTAT_BUFFER_SIZE) if _load_bulkstat() else None
     total_size = 0
+    seen = set()
+    # Each level: (descriptor, path, subdirectory names still to visit)
+    stack = [(fd, path, [])]
     try:
-        path_obj = Path(path)
-        if path_obj.is_file():
-            return path_obj.stat().st_size
-        for entry in path_obj.rglob('*'):
+        st = os.fstat(fd)
+        if st.st_dev != root_dev:
+            return 0, False
+        seen.add((st.st_dev, st.st_ino))
+        total_size, subdirs = _list_directory(fd, root_dev, buf)
+        stack[0] = (fd, path, subdirs)
+        while stack:
+            fd, dir_path, pending = stack[-1]
+            if not pending:
+                stack.pop()
+                os.close(fd)
+                continue
+            if deadline is not None and time.monotonic() > deadline:
+                return total_size, True
+            name = pending.pop()
+            child_path = os.path.join(dir_path, name)
+            if child_path in exclude:
+                continue
             try:
-                if entry.is_file():
-                    total_size += entry.stat().st_size
-            except:
-                pass
-    except:
+                child_fd = os.open(name, os.O_RDONLY | O_DIRECTORY | O_NOFOLLOW, dir_fd=fd)
+            except OSError:
+                continue
+            # On the stack straight away so it is closed whatever happens next
+            stack.append((child_fd, child_path, []))
+            try:
+                st = os.fstat(child_fd)
+            except OSError:
+                continue
+            key = (st.st_dev, st.st_ino)
+            if st.st_dev != root_dev or key in seen:
+                continue
+            seen.add(key)
+            files_size, subdirs = _list_directory(child_fd, root_dev, buf)
+            total_size += files_size
+            stack[-1] = (child_fd, child_path, subdirs)
+    finally:
+        for fd, _, _ in stack:
+            os.close(fd)
+    return total_size, False
+
+
+def _list_directory(fd: int, root_dev: int, buf) -> Tuple[int, List[str]]:
+    """Return (size of fd's regular files, subdirectories to descend)."""
+    files_size = 0
+    subdirs = []
+    try:
+        if buf is not None:
+            for name, obj_type, (dev, _), alloc in _bulk_entries(_load_bulkstat(), fd, buf):
+                if obj_type == VREG:
+                    files_size += alloc
+                elif obj_type == VDIR and dev == root_dev:
+                    name = os.fsdecode(name)
+                    if name not in WALK_SKIP_NAMES:
+                        subdirs.append(name)
+        else:
+            with os.scandir(fd) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        entry_st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if entry_st.st_dev == root_dev and entry.name not in WALK_SKIP_NAMES:
+                            subdirs.append(entry.name)
+                    elif stat.S_ISREG(entry_st.st_mode):
+                        files_size += entry_st.st_blocks * 512
+    except OSError:
         pass
-    return total_size
+    return files_size, subdirs
+
+
+# getattrlistbulk(2) returns the attributes of a whole batch of directory
+# entries per call, where scandir needs an fstatat() for every file
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_DEVID = 0x00000002
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_FILEID = 0x02000000
+ATTR_CMN_ERROR = 0x20000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_ALLOCSIZE = 0x00000004
+VREG, VDIR = 1, 2
+BULKSTAT_BUFFER_SIZE = 64 * 1024
+_bulkstat = None
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ('bitmapcount', ctypes.c_ushort),
+        ('reserved', ctypes.c_uint16),
+        ('commonattr', ctypes.c_uint32),
+        ('volattr', ctypes.c_uint32),
+        ('dirattr', ctypes.c_uint32),
+        ('fileattr', ctypes.c_uint32),
+        ('forkattr', ctypes.c_uint32),
+    ]
+
+
+def _load_bulkstat():
+    """Bind getattrlistbulk from libSystem, or None off macOS."""
+    global _bulkstat
+    if _bulkstat is not None:
+        return _bulkstat or None
+    _bulkstat = False
+    if sys.platform != 'darwin':
+        return None
+    try:
+        libc = ctypes.CDLL('/usr/lib/libSystem.B.dylib', use_errno=True)
+        getattrlistbulk = libc.getattrlistbulk
+    except (OSError, AttributeError):
+        return None
+    getattrlistbulk.restype = ctypes.c_int
+    getattrlistbulk.argtypes = [ctypes.c_int, ctypes.POINTER(_AttrList),
+                                ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint64]
+    attrs = _AttrList(
+        bitmapcount=ATTR_BIT_MAP_COUNT,
+        commonattr=(ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_ERROR | ATTR_CMN_NAME |
+                    ATTR_CMN_DEVID | ATTR_CMN_OBJTYPE | ATTR_CMN_FILEID),
+        fileattr=ATTR_FILE_ALLOCSIZE
+    )
+    _bulkstat = (getattrlistbulk, attrs)
+    return _bulkstat
+
+
+def _bulk_entries(bulk, fd: int, buf) -> Iterator[Tuple[bytes, int, tuple, int]]:
+    """Yield (name, object type, (dev, ino), allocated size) for each entry of fd."""
+    getattrlistbulk, attrs = bulk
+    base = ctypes.addressof(buf)
+    while True:
+        count = getattrlistbulk(fd, ctypes.byref(attrs), buf, len(buf), 0)
+        if count < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        if count == 0:
+            return
+        offset = 0
+        for _ in range(count):
+            # Attributes are packed in bit order, each 4-byte aligned, and
+            # only those listed in the returned set are present
+            length, common, _, _, file_attrs, _ = struct.unpack_from('=I5I', buf, offset)
+            pos = offset + 24
+            offset += length
+            if common & ATTR_CMN_ERROR:
+                error, = struct.unpack_from('=I', buf, pos)
+                pos += 4
+                if error:
+                    continue
+            name_off, name_len = struct.unpack_from('=iI', buf, pos)
+            name = ctypes.string_at(base + pos + name_off, max(name_len - 1, 0))
+            pos += 8
+            dev, obj_type, ino = struct.unpack_from('=iIQ', buf, pos)
+            pos += 16
+            alloc = 0
+            if file_attrs & ATTR_FILE_ALLOCSIZE:
+                alloc, = struct.unpack_from('=q', buf, pos)
+            yield name, obj_type, (dev, ino), alloc
+
+
+def measure_directory_size(path: str, exclude=frozenset(), st: os.stat_result = None) -> Tuple[int, bool]:
+    """Return (disk usage, partial) for path, skipping subtrees in `exclude`.
+
+    Each walk gets SIZE_WALK_TIME_BUDGET seconds; partial is True when a
+    pathological tree was cut short and the size is a lower bound. Pass
+    `st` when the caller has already stat'ed path.
+    """
+    if st is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return 0, False
+    if stat.S_ISREG(st.st_mode):
+        return st.st_blocks * 512, False
+    if not stat.S_ISDIR(st.st_mode):
+        return 0, False
+    if st.st_nlink == 2:
+        # No subdirectories (POSIX link count), so a single listing is enough
+        return _shallow_size(path), False
+
+    return _walk_size(path, exclude, time.monotonic() + SIZE_WALK_TIME_BUDGET)
+
+
+def get_directory_size(path: str, exclude=frozenset()) -> int:
+    """Return the disk usage of path, skipping any subtrees in `exclude`."""
+    return measure_directory_size(path, exclude)[0]
 
 
 # ============================================================================
@@ -124,33 +636,40 @@ def get_directory_size(path: str) -> int:
 # ============================================================================
 
 # Global state for leftovers
-leftover_results = []
-leftover_scan_in_progress = False
-leftover_scan_complete = False
-leftover_scan_progress = {
-    "current": 0,
-    "total": 0,
-    "percent": 0,
-    "current_location": "",
-    "found_count": 0,
-    "total_size": 0
-}
+leftover_state = ScanState()
+
+
+PLIST_MMAP_MIN_SIZE = 16 * 1024
+MMAP_READ_ADVICE = tuple(
+    getattr(mmap, name) for name in ('MADV_SEQUENTIAL', 'MADV_WILLNEED') if hasattr(mmap, name)
+)
 
 
 def parse_plist_bundle_id(plist_path: str) -> str:
     """Extract CFBundleIdentifier from an Info.plist file."""
+    # plistlib reads both XML and binary plists, no need to fork `defaults`
     try:
-        result = subprocess.run(
-            ['defaults', 'read', plist_path, 'CFBundleIdentifier'],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except:
-        pass
-    return ""
+        with open(plist_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= PLIST_MMAP_MIN_SIZE:
+                # Large plists are mapped with read-ahead advice; small ones
+                # would spend more on the mapping than on the read
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for advice in MMAP_READ_ADVICE:
+                        mm.madvise(advice)
+                    plist = plistlib.load(mm)
+            else:
+                plist = plistlib.load(f)
+    except Exception:
+        return ""
+    bundle_id = plist.get('CFBundleIdentifier') if isinstance(plist, dict) else None
+    return bundle_id.strip() if isinstance(bundle_id, str) else ""
 
 
+# Boundary between a lowercase and an uppercase letter, e.g. "myApp"
+CAMEL_CASE_RE = re.compile(r'([a-z])([A-Z])')
+
+
+@lru_cache(maxsize=4096)
 def infer_app_name(bundle_id: str) -> str:
     """Infer a human-readable app name from a bundle identifier."""
     if not bundle_id:
@@ -162,8 +681,7 @@ def infer_app_name(bundle_id: str) -> str:
         # Get the last part, capitalize it, and clean up
         name = parts[-1]
         # Convert camelCase or PascalCase to spaces
-        import re
-        name = re.sub(r'([a-z])([A-Z])', r'\1 \2', name)
+        name = CAMEL_CASE_RE.sub(r'\1 \2', name)
         # Convert dashes/underscores to spaces
         name = name.replace('-', ' ').replace('_', ' ')
         # Capitalize words
@@ -171,100 +689,305 @@ def infer_app_name(bundle_id: str) -> str:
     return bundle_id
 
 
-def get_installed_bundle_ids() -> set:
-    """Get all bundle IDs from currently installed applications."""
+def _read_bundle_ids(plist_paths) -> set:
+    """Lowercased bundle IDs from a batch of Info.plist paths.
+
+    The reads are spread over the shared worker pool so their open/read
+    latency overlaps; missing or unreadable plists are simply skipped.
+    """
+    return {
+        bundle_id.lower()
+        for bundle_id in _SIZE_POOL.map(parse_plist_bundle_id, plist_paths)
+        if bundle_id
+    }
+
+
+# Spotlight query through the MDQuery C API, avoids forking mdfind and
+# returns the bundle identifiers directly instead of paths to re-read
+APP_BUNDLE_QUERY = 'kMDItemContentType == "com.apple.application-bundle"'
+kCFStringEncodingUTF8 = 0x08000100
+kMDQuerySynchronous = 1
+_spotlight = None
+
+
+def _load_spotlight():
+    """Bind the CoreFoundation/CoreServices calls we need, or None if unavailable."""
+    global _spotlight
+    if _spotlight is not None:
+        return _spotlight or None
+    _spotlight = False
+    if sys.platform != 'darwin':
+        return None
+    try:
+        cf = ctypes.CDLL('/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation')
+        cs = ctypes.CDLL('/System/Library/Frameworks/CoreServices.framework/CoreServices')
+    except OSError:
+        return None
+
+    vp, idx = ctypes.c_void_p, ctypes.c_long
+    cf.CFStringCreateWithCString.restype = vp
+    cf.CFStringCreateWithCString.argtypes = [vp, ctypes.c_char_p, ctypes.c_uint32]
+    cf.CFArrayCreate.restype = vp
+    cf.CFArrayCreate.argtypes = [vp, ctypes.POINTER(vp), idx, vp]
+    cf.CFRelease.restype = None
+    cf.CFRelease.argtypes = [vp]
+    cf.CFGetTypeID.restype = ctypes.c_ulong
+    cf.CFGetTypeID.argtypes = [vp]
+    cf.CFStringGetTypeID.restype = ctypes.c_ulong
+    cf.CFStringGetTypeID.argtypes = []
+    cf.CFStringGetCStringPtr.restype = ctypes.c_char_p
+    cf.CFStringGetCStringPtr.argtypes = [vp, ctypes.c_uint32]
+    cf.CFStringGetLength.restype = idx
+    cf.CFStringGetLength.argtypes = [vp]
+    cf.CFStringGetMaximumSizeForEncoding.restype = idx
+    cf.CFStringGetMaximumSizeForEncoding.argtypes = [idx, ctypes.c_uint32]
+    cf.CFStringGetCString.restype = ctypes.c_bool
+    cf.CFStringGetCString.argtypes = [vp, ctypes.c_char_p, idx, ctypes.c_uint32]
+    cs.MDQueryCreate.restype = vp
+    cs.MDQueryCreate.argtypes = [vp, vp, vp, vp]
+    cs.MDQueryExecute.restype = ctypes.c_bool
+    cs.MDQueryExecute.argtypes = [vp, ctypes.c_ulong]
+    cs.MDQueryGetResultCount.restype = idx
+    cs.MDQueryGetResultCount.argtypes = [vp]
+    cs.MDQueryGetAttributeValueOfResultAtIndex.restype = vp
+    cs.MDQueryGetAttributeValueOfResultAtIndex.argtypes = [vp, vp, idx]
+
+    def cfstr(text: str):
+        return cf.CFStringCreateWithCString(None, text.encode('utf-8'), kCFStringEncodingUTF8)
+
+    # Created once and kept for the life of the process
+    bundle_attr = cfstr('kMDItemCFBundleIdentifier')
+    _spotlight = {
+        'cf': cf,
+        'cs': cs,
+        'cfstr': cfstr,
+        'string_type': cf.CFStringGetTypeID(),
+        'array_callbacks': ctypes.addressof(ctypes.c_void_p.in_dll(cf, 'kCFTypeArrayCallBacks')),
+        'bundle_attr': bundle_attr,
+        'query': cfstr(APP_BUNDLE_QUERY),
+    }
+    return _spotlight
+
+
+def _cfstring_to_str(cf, ref) -> str:
+    fast = cf.CFStringGetCStringPtr(ref, kCFStringEncodingUTF8)
+    if fast is not None:
+        return fast.decode('utf-8', 'replace')
+    size = cf.CFStringGetMaximumSizeForEncoding(cf.CFStringGetLength(ref), kCFStringEncodingUTF8) + 1
+    buf = ctypes.create_string_buffer(size)
+    if cf.CFStringGetCString(ref, buf, size, kCFStringEncodingUTF8):
+        return buf.value.decode('utf-8', 'replace')
+    return ""
+
+
+def _spotlight_bundle_ids():
+    """Return bundle IDs of all indexed applications, or None if Spotlight can't be queried."""
+    sl = _load_spotlight()
+    if sl is None:
+        return None
+    cf, cs = sl['cf'], sl['cs']
+    attrs = (ctypes.c_void_p * 1)(sl['bundle_attr'])
+    value_list = cf.CFArrayCreate(None, attrs, 1, sl['array_callbacks'])
+    if not value_list:
+        return None
+    query = cs.MDQueryCreate(None, sl['query'], value_list, None)
+    cf.CFRelease(value_list)
+    if not query:
+        return None
+    try:
+        if not cs.MDQueryExecute(query, kMDQuerySynchronous):
+            return None
+        bundle_ids = set()
+        for i in range(cs.MDQueryGetResultCount(query)):
+            # Borrowed reference, owned by the query
+            value = cs.MDQueryGetAttributeValueOfResultAtIndex(query, sl['bundle_attr'], i)
+            if value and cf.CFGetTypeID(value) == sl['string_type']:
+                bundle_id = _cfstring_to_str(cf, value).strip()
+                if bundle_id:
+                    bundle_ids.add(bundle_id.lower())
+        return bundle_ids
+    finally:
+        cf.CFRelease(query)
+
+
+def _mdfind_bundle_ids() -> set:
+    """Spotlight lookup through the mdfind CLI, used when MDQuery can't be loaded."""
     bundle_ids = set()
-    
     try:
-        # Method 1: Use mdfind to query Spotlight for all applications
         result = subprocess.run(
-            ['mdfind', 'kMDItemContentType == "com.apple.application-bundle"'],
-            capture_output=True, text=True, timeout=30
+            ['mdfind', APP_BUNDLE_QUERY],
+            capture_output=True, timeout=30
         )
         
         if result.returncode == 0:
-            for app_path in result.stdout.strip().split('\n'):
-                if app_path and os.path.exists(app_path):
-                    plist_path = os.path.join(app_path, 'Contents', 'Info.plist')
-                    if os.path.exists(plist_path):
-                        bundle_id = parse_plist_bundle_id(plist_path)
-                        if bundle_id:
-                            bundle_ids.add(bundle_id.lower())
+            # Paths stay bytes; open() takes them as-is, so nothing is decoded
+            bundle_ids.update(_read_bundle_ids(
+                os.path.join(app_path, b'Contents', b'Info.plist')
+                for app_path in result.stdout.splitlines() if app_path
+            ))
     except:
         pass
+    return bundle_ids
+
+
+def _collect_installed_bundle_ids() -> set:
+    """Get all bundle IDs from currently installed applications."""
+    # Method 1: Query Spotlight for all applications
+    bundle_ids = _spotlight_bundle_ids()
+    if bundle_ids is None:
+        bundle_ids = _mdfind_bundle_ids()
     
     # Method 2: Also scan /Applications directly as fallback
-    try:
-        apps_dir = Path('/Applications')
-        for app in apps_dir.glob('*.app'):
-            plist_path = app / 'Contents' / 'Info.plist'
-            if plist_path.exists():
-                bundle_id = parse_plist_bundle_id(str(plist_path))
-                if bundle_id:
-                    bundle_ids.add(bundle_id.lower())
-    except:
-        pass
-    
     # Method 3: Also check user Applications
-    try:
-        user_apps = Path.home() / 'Applications'
-        if user_apps.exists():
-            for app in user_apps.glob('*.app'):
-                plist_path = app / 'Contents' / 'Info.plist'
-                if plist_path.exists():
-                    bundle_id = parse_plist_bundle_id(str(plist_path))
-                    if bundle_id:
-                        bundle_ids.add(bundle_id.lower())
-    except:
-        pass
+    plist_paths = []
+    for apps_dir in (Path('/Applications'), Path(HOME) / 'Applications'):
+        try:
+            plist_paths.extend(str(app / 'Contents' / 'Info.plist') for app in apps_dir.glob('*.app'))
+        except OSError:
+            pass
+    bundle_ids.update(_read_bundle_ids(plist_paths))
     
     return bundle_ids
 
 
-def detect_container_orphans(installed_ids: set) -> List[LeftoverItem]:
+# Installed apps rarely change between scans run seconds apart
+BUNDLE_ID_CACHE_TTL = 60.0
+_bundle_id_cache = {"ts": 0.0, "apps_mtimes": None, "ids": None}
+
+
+def _apps_dir_mtimes() -> tuple:
+    """mtimes of the Applications folders; installing or removing an app bumps them."""
+    mtimes = []
+    for apps_dir in ('/Applications', os.path.join(HOME, 'Applications')):
+        try:
+            mtimes.append(os.stat(apps_dir).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def get_installed_bundle_ids() -> frozenset:
+    """Installed bundle IDs, reused for BUNDLE_ID_CACHE_TTL seconds.
+
+    The snapshot is also dropped when an Applications folder changes.
+    """
+    now = time.monotonic()
+    apps_mtimes = _apps_dir_mtimes()
+    cache = _bundle_id_cache
+    if (cache["ids"] is not None and now - cache["ts"] < BUNDLE_ID_CACHE_TTL
+            and cache["apps_mtimes"] == apps_mtimes):
+        return cache["ids"]
+    bundle_ids = frozenset(_collect_installed_bundle_ids())
+    cache.update(ts=now, apps_mtimes=apps_mtimes, ids=bundle_ids)
+    return bundle_ids
+
+
+class InstalledIdIndex:
+    """Installed bundle IDs indexed for the detectors' name matching.
+
+    Built once per scan, so each candidate is checked with a set lookup,
+    one compiled regex search or one substring search instead of a loop
+    over every installed ID. The answers match the original loops exactly.
+    """
+    __slots__ = ('ids', 'components', '_haystack', '_id_pattern')
+
+    def __init__(self, installed_ids):
+        self.ids = frozenset(installed_ids)
+        self.components = frozenset(
+            part for installed_id in self.ids for part in installed_id.split('.')
+        )
+        # NUL never appears in a file name, so a match can't span two IDs
+        self._haystack = "\0".join(self.ids)
+        self._id_pattern = (
+            re.compile('|'.join(map(re.escape, sorted(self.ids, key=len, reverse=True))))
+            if self.ids else None
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def contains_id(self, name: str) -> bool:
+        """True if some installed ID is a substring of name."""
+        return self._id_pattern is not None and self._id_pattern.search(name) is not None
+
+    def within_id(self, name: str) -> bool:
+        """True if name is a substring of some installed ID."""
+        return bool(self.ids) and name in self._haystack
+
+    def is_component(self, name: str) -> bool:
+        """True if name equals one dotted part of some installed ID."""
+        return name in self.components
+
+
+def _list_dir(path) -> List[os.DirEntry]:
+    """Read a directory in a single pass.
+
+    The returned entries carry the file type from the directory listing,
+    so is_dir()/is_file() checks need no extra stat() per entry.
+    """
+    with os.scandir(path) as it:
+        return list(it)
+
+
+# Shared by all leftover detectors (and the Info.plist reads) so their
+# combined filesystem work stays capped
+SIZE_POOL_WORKERS = 16
+_SIZE_POOL = ThreadPoolExecutor(max_workers=SIZE_POOL_WORKERS)
+
+
+def _size_candidates(entries) -> Iterator[Tuple[os.DirEntry, int]]:
+    """Measure candidate directories concurrently, yielding them in order."""
+    if on_rotational_disk(HOME):
+        # Parallel walks only thrash a spinning disk's heads
+        for entry in entries:
+            yield entry, get_directory_size(entry.path)
+        return
+    futures = [(entry, _SIZE_POOL.submit(get_directory_size, entry.path)) for entry in entries]
+    for entry, future in futures:
+        yield entry, future.result()
+
+
+def detect_container_orphans(installed_ids: InstalledIdIndex) -> Iterator[LeftoverItem]:
     """Find containers for apps that are no longer installed."""
-    orphans = []
-    containers_path = Path.home() / 'Library' / 'Containers'
-    
-    if not containers_path.exists():
-        return orphans
+    containers_path = Path(HOME) / 'Library' / 'Containers'
     
     try:
-        for container in containers_path.iterdir():
+        candidates = []
+        for container in _list_dir(containers_path):
             if container.is_dir():
                 container_id = container.name.lower()
                 if container_id not in installed_ids:
-                    size = get_directory_size(str(container))
-                    if size > 0:  # Only include non-empty containers
-                        orphans.append(LeftoverItem(
-                            id=f"container_{container.name}",
-                            path=str(container),
-                            name=infer_app_name(container.name),
-                            bundle_id=container.name,
-                            detection_source="container_scan",
-                            category="Containers",
-                            confidence="high",
-                            hint=f"Sandboxed data container for '{infer_app_name(container.name)}'. This app appears to be uninstalled.",
-                            size=size,
-                            size_human=human_readable_size(size),
-                            selected=True
-                        ))
+                    candidates.append(container)
+        
+        for container, size in _size_candidates(candidates):
+            if size > 0:  # Only include non-empty containers
+                yield LeftoverItem(
+                    id=f"container_{container.name}",
+                    path=container.path,
+                    name=infer_app_name(container.name),
+                    bundle_id=container.name,
+                    detection_source="container_scan",
+                    category="Containers",
+                    confidence="high",
+                    hint=f"Sandboxed data container for '{infer_app_name(container.name)}'. This app appears to be uninstalled.",
+                    size=size,
+                    size_human=human_readable_size(size),
+                    selected=True
+                )
     except:
         pass
-    
-    return orphans
 
 
-def detect_group_container_orphans(installed_ids: set) -> List[LeftoverItem]:
+def detect_group_container_orphans(installed_ids: InstalledIdIndex) -> Iterator[LeftoverItem]:
     """Find group containers for apps that are no longer installed."""
-    orphans = []
-    group_containers_path = Path.home() / 'Library' / 'Group Containers'
-    
-    if not group_containers_path.exists():
-        return orphans
+    group_containers_path = Path(HOME) / 'Library' / 'Group Containers'
     
     try:
-        for container in group_containers_path.iterdir():
+        candidates = []
+        for container in _list_dir(group_containers_path):
             if container.is_dir():
                 # Group containers have format: TEAMID.com.example.group
                 container_id = container.name.lower()
@@ -276,562 +999,628 @@ def detect_group_container_orphans(installed_ids: set) -> List[LeftoverItem]:
                     bundle_portion = container_id
                 
                 # Check if any installed app matches this group container
-                is_orphan = True
-                for installed_id in installed_ids:
-                    if installed_id in container_id or bundle_portion in installed_id:
-                        is_orphan = False
-                        break
+                is_orphan = not (installed_ids.contains_id(container_id)
+                                 or installed_ids.within_id(bundle_portion))
                 
                 if is_orphan:
-                    size = get_directory_size(str(container))
-                    if size > 0:
-                        orphans.append(LeftoverItem(
-                            id=f"group_container_{container.name}",
-                            path=str(container),
-                            name=infer_app_name(container.name),
-                            bundle_id=container.name,
-                            detection_source="group_container_scan",
-                            category="Group Containers",
-                            confidence="high",
-                            hint=f"Shared data container for '{infer_app_name(container.name)}'. No matching app found.",
-                            size=size,
-                            size_human=human_readable_size(size),
-                            selected=True
-                        ))
+                    candidates.append(container)
+        
+        for container, size in _size_candidates(candidates):
+            if size > 0:
+                yield LeftoverItem(
+                    id=f"group_container_{container.name}",
+                    path=container.path,
+                    name=infer_app_name(container.name),
+                    bundle_id=container.name,
+                    detection_source="group_container_scan",
+                    category="Group Containers",
+                    confidence="high",
+                    hint=f"Shared data container for '{infer_app_name(container.name)}'. No matching app found.",
+                    size=size,
+                    size_human=human_readable_size(size),
+                    selected=True
+                )
     except:
         pass
-    
-    return orphans
 
 
-def detect_preference_orphans(installed_ids: set) -> List[LeftoverItem]:
+# Known system/Apple preferences to skip, lowercased once so that
+# str.startswith() can test the whole tuple in one call
+PREF_SKIP_PREFIXES = tuple(name.lower() for name in (
+    'com.apple.', 'org.python.', 'com.github.', 'loginwindow',
+    'pbs', 'systemsoundserverd', 'ContextStoreAgent', 'NSGlobalDomain'
+))
+
+
+def detect_preference_orphans(installed_ids: InstalledIdIndex) -> Iterator[LeftoverItem]:
     """Find preference files for apps that are no longer installed."""
-    orphans = []
-    prefs_path = Path.home() / 'Library' / 'Preferences'
-    
-    if not prefs_path.exists():
-        return orphans
-    
-    # Known system/Apple preferences to skip
-    skip_prefixes = ['com.apple.', 'org.python.', 'com.github.', 'loginwindow',
-                     'pbs', 'systemsoundserverd', 'ContextStoreAgent', 'NSGlobalDomain']
+    prefs_path = Path(HOME) / 'Library' / 'Preferences'
     
     try:
-        for pref_file in prefs_path.glob('*.plist'):
-            if pref_file.is_file():
-                pref_name = pref_file.stem.lower()
+        for pref_file in _list_dir(prefs_path):
+            # Same selection as glob('*.plist'), from the dirent alone
+            if (pref_file.name.endswith('.plist') and not pref_file.name.startswith('.')
+                    and pref_file.is_file()):
+                pref_stem = pref_file.name[:-len('.plist')]
+                pref_name = pref_stem.lower()
                 
                 # Skip known system preferences
-                if any(pref_name.startswith(prefix.lower()) for prefix in skip_prefixes):
+                if pref_name.startswith(PREF_SKIP_PREFIXES):
                     continue
                 
                 # Check if this preference belongs to an installed app
-                is_orphan = True
-                for installed_id in installed_ids:
-                    if pref_name == installed_id or pref_name.startswith(installed_id):
-                        is_orphan = False
-                        break
-                    if installed_id in pref_name:
-                        is_orphan = False
-                        break
+                # (an exact or prefix match is also a substring match)
+                is_orphan = not installed_ids.contains_id(pref_name)
                 
                 if is_orphan:
                     size = pref_file.stat().st_size
                     if size > 0:
-                        orphans.append(LeftoverItem(
-                            id=f"pref_{pref_file.stem}",
-                            path=str(pref_file),
-                            name=infer_app_name(pref_file.stem),
-                            bundle_id=pref_file.stem,
+                        yield LeftoverItem(
+                            id=f"pref_{pref_stem}",
+                            path=pref_file.path,
+                            name=infer_app_name(pref_stem),
+                            bundle_id=pref_stem,
                             detection_source="preferences_scan",
                             category="Preferences",
                             confidence="medium",
-                            hint=f"Preference file for '{infer_app_name(pref_file.stem)}'. No matching app installed.",
+                            hint=f"Preference file for '{infer_app_name(pref_stem)}'. No matching app installed.",
                             size=size,
                             size_human=human_readable_size(size),
                             selected=True
-                        ))
+                        )
     except:
         pass
-    
-    return orphans
 
 
-def detect_app_support_orphans(installed_ids: set) -> List[LeftoverItem]:
+# Known system/essential folders to skip
+APP_SUPPORT_SKIP_PREFIXES = tuple(name.lower() for name in (
+    'AddressBook', 'AppStore', 'CallHistoryDB', 'CloudDocs',
+    'CrashReporter', 'Dock', 'FileProvider', 'iCloud', 'icdd',
+    'Knowledge', 'MobileSync', 'NotificationCenter', 'Quick Look',
+    'Spotlight', 'com.apple.', 'Apple', 'SyncServices', 'CoreData'
+))
+
+
+def detect_app_support_orphans(installed_ids: InstalledIdIndex) -> Iterator[LeftoverItem]:
     """Find Application Support folders for apps that are no longer installed."""
-    orphans = []
-    app_support_path = Path.home() / 'Library' / 'Application Support'
-    
-    if not app_support_path.exists():
-        return orphans
-    
-    # Known system/essential folders to skip
-    skip_folders = ['AddressBook', 'AppStore', 'CallHistoryDB', 'CloudDocs',
-                    'CrashReporter', 'Dock', 'FileProvider', 'iCloud', 'icdd',
-                    'Knowledge', 'MobileSync', 'NotificationCenter', 'Quick Look',
-                    'Spotlight', 'com.apple.', 'Apple', 'SyncServices', 'CoreData']
+    app_support_path = Path(HOME) / 'Library' / 'Application Support'
     
     try:
-        for folder in app_support_path.iterdir():
+        candidates = []
+        for folder in _list_dir(app_support_path):
             if folder.is_dir():
                 folder_name = folder.name.lower()
                 
-                # Skip known system folders
-                if any(folder_name.startswith(skip.lower()) or folder_name == skip.lower() 
-                       for skip in skip_folders):
+                # Skip known system folders (an exact match is also a prefix match)
+                if folder_name.startswith(APP_SUPPORT_SKIP_PREFIXES):
                     continue
                 
                 # Check if this folder belongs to an installed app
-                is_orphan = True
-                for installed_id in installed_ids:
-                    # Match by last portion of bundle ID or folder name
-                    installed_parts = installed_id.split('.')
-                    if folder_name in installed_id or installed_id in folder_name:
-                        is_orphan = False
-                        break
-                    if any(part.lower() == folder_name for part in installed_parts):
-                        is_orphan = False
-                        break
+                # Match by any portion of a bundle ID or folder name
+                is_orphan = not (installed_ids.within_id(folder_name)
+                                 or installed_ids.contains_id(folder_name)
+                                 or installed_ids.is_component(folder_name))
                 
                 if is_orphan:
-                    size = get_directory_size(str(folder))
-                    if size > 1024:  # Only include folders > 1KB
-                        orphans.append(LeftoverItem(
-                            id=f"appsupport_{folder.name}",
-                            path=str(folder),
-                            name=folder.name,
-                            bundle_id=f"*.{folder.name}",
-                            detection_source="app_support_scan",
-                            category="Application Support",
-                            confidence="medium",
-                            hint=f"Application Support folder for '{folder.name}'. No matching app installed.",
-                            size=size,
-                            size_human=human_readable_size(size),
-                            selected=True
-                        ))
+                    candidates.append(folder)
+        
+        for folder, size in _size_candidates(candidates):
+            if size > 1024:  # Only include folders > 1KB
+                yield LeftoverItem(
+                    id=f"appsupport_{folder.name}",
+                    path=folder.path,
+                    name=folder.name,
+                    bundle_id=f"*.{folder.name}",
+                    detection_source="app_support_scan",
+                    category="Application Support",
+                    confidence="medium",
+                    hint=f"Application Support folder for '{folder.name}'. No matching app installed.",
+                    size=size,
+                    size_human=human_readable_size(size),
+                    selected=True
+                )
     except:
         pass
-    
-    return orphans
 
 
-def detect_launch_agent_orphans(installed_ids: set) -> List[LeftoverItem]:
+# Known system launch agents to skip
+LAUNCH_AGENT_SKIP_PREFIXES = tuple(name.lower() for name in (
+    'com.apple.', 'com.openssh', 'bootcamp', 'org.gpgtools'
+))
+
+
+def detect_launch_agent_orphans(installed_ids: InstalledIdIndex) -> Iterator[LeftoverItem]:
     """Find Launch Agents for apps that are no longer installed."""
-    orphans = []
     
     # Check both user and system launch agents
     launch_agent_paths = [
-        Path.home() / 'Library' / 'LaunchAgents',
+        Path(HOME) / 'Library' / 'LaunchAgents',
         Path('/Library/LaunchAgents'),
     ]
     
-    # Known system launch agents to skip
-    skip_prefixes = ['com.apple.', 'com.openssh', 'bootcamp', 'org.gpgtools']
-    
     for launch_path in launch_agent_paths:
-        if not launch_path.exists():
-            continue
-        
         try:
-            for plist_file in launch_path.glob('*.plist'):
-                if plist_file.is_file():
-                    plist_name = plist_file.stem.lower()
+            for plist_file in _list_dir(launch_path):
+                if (plist_file.name.endswith('.plist') and not plist_file.name.startswith('.')
+                        and plist_file.is_file()):
+                    plist_stem = plist_file.name[:-len('.plist')]
+                    plist_name = plist_stem.lower()
                     
                     # Skip known system agents
-                    if any(plist_name.startswith(prefix.lower()) for prefix in skip_prefixes):
+                    if plist_name.startswith(LAUNCH_AGENT_SKIP_PREFIXES):
                         continue
                     
                     # Check if this launch agent belongs to an installed app
-                    is_orphan = True
-                    for installed_id in installed_ids:
-                        if plist_name == installed_id or installed_id in plist_name:
-                            is_orphan = False
-                            break
-                        if plist_name in installed_id:
-                            is_orphan = False
-                            break
+                    is_orphan = not (installed_ids.contains_id(plist_name)
+                                     or installed_ids.within_id(plist_name))
                     
                     if is_orphan:
                         size = plist_file.stat().st_size
-                        orphans.append(LeftoverItem(
-                            id=f"launchagent_{plist_file.stem}",
-                            path=str(plist_file),
-                            name=infer_app_name(plist_file.stem),
-                            bundle_id=plist_file.stem,
+                        yield LeftoverItem(
+                            id=f"launchagent_{plist_stem}",
+                            path=plist_file.path,
+                            name=infer_app_name(plist_stem),
+                            bundle_id=plist_stem,
                             detection_source="launch_agent_scan",
                             category="Launch Agents",
                             confidence="high",
-                            hint=f"Background agent for '{infer_app_name(plist_file.stem)}'. The associated app is not installed.",
+                            hint=f"Background agent for '{infer_app_name(plist_stem)}'. The associated app is not installed.",
                             size=size,
                             size_human=human_readable_size(size),
                             selected=True
-                        ))
+                        )
         except:
             pass
-    
-    return orphans
 
 
-def detect_cache_orphans(installed_ids: set) -> List[LeftoverItem]:
+# Known system caches to skip
+CACHE_SKIP_PREFIXES = tuple(name.lower() for name in (
+    'com.apple.', 'CloudKit', 'GeoServices', 'PassKit',
+    'com.crashlytics', 'google', 'org.swift'
+))
+
+
+def detect_cache_orphans(installed_ids: InstalledIdIndex) -> Iterator[LeftoverItem]:
     """Find cache folders for apps that are no longer installed."""
-    orphans = []
-    caches_path = Path.home() / 'Library' / 'Caches'
-    
-    if not caches_path.exists():
-        return orphans
-    
-    # Known system caches to skip
-    skip_prefixes = ['com.apple.', 'CloudKit', 'GeoServices', 'PassKit',
-                     'com.crashlytics', 'google', 'org.swift']
+    caches_path = Path(HOME) / 'Library' / 'Caches'
     
     try:
-        for cache_folder in caches_path.iterdir():
+        candidates = []
+        for cache_folder in _list_dir(caches_path):
             if cache_folder.is_dir():
                 cache_name = cache_folder.name.lower()
                 
                 # Skip known system caches
-                if any(cache_name.startswith(prefix.lower()) for prefix in skip_prefixes):
+                if cache_name.startswith(CACHE_SKIP_PREFIXES):
                     continue
                 
                 # Check if this cache belongs to an installed app
-                is_orphan = True
-                for installed_id in installed_ids:
-                    if cache_name == installed_id or installed_id in cache_name:
-                        is_orphan = False
-                        break
-                    if cache_name in installed_id:
-                        is_orphan = False
-                        break
+                is_orphan = not (installed_ids.contains_id(cache_name)
+                                 or installed_ids.within_id(cache_name))
                 
                 if is_orphan:
-                    size = get_directory_size(str(cache_folder))
-                    if size > 10240:  # Only include caches > 10KB
-                        orphans.append(LeftoverItem(
-                            id=f"cache_{cache_folder.name}",
-                            path=str(cache_folder),
-                            name=infer_app_name(cache_folder.name),
-                            bundle_id=cache_folder.name,
-                            detection_source="cache_scan",
-                            category="Caches",
-                            confidence="medium",
-                            hint=f"Cache folder for '{infer_app_name(cache_folder.name)}'. No matching app installed.",
-                            size=size,
-                            size_human=human_readable_size(size),
-                            selected=True
-                        ))
+                    candidates.append(cache_folder)
+        
+        for cache_folder, size in _size_candidates(candidates):
+            if size > 10240:  # Only include caches > 10KB
+                yield LeftoverItem(
+                    id=f"cache_{cache_folder.name}",
+                    path=cache_folder.path,
+                    name=infer_app_name(cache_folder.name),
+                    bundle_id=cache_folder.name,
+                    detection_source="cache_scan",
+                    category="Caches",
+                    confidence="medium",
+                    hint=f"Cache folder for '{infer_app_name(cache_folder.name)}'. No matching app installed.",
+                    size=size,
+                    size_human=human_readable_size(size),
+                    selected=True
+                )
     except:
         pass
-    
-    return orphans
 
 
-def detect_logs_orphans(installed_ids: set) -> List[LeftoverItem]:
+# Known system logs to skip
+LOGS_SKIP_PREFIXES = tuple(name.lower() for name in (
+    'DiagnosticReports', 'com.apple.', 'CoreSimulator', 'Homebrew'
+))
+
+
+def detect_logs_orphans(installed_ids: InstalledIdIndex) -> Iterator[LeftoverItem]:
     """Find log folders for apps that are no longer installed."""
-    orphans = []
-    logs_path = Path.home() / 'Library' / 'Logs'
-    
-    if not logs_path.exists():
-        return orphans
-    
-    # Known system logs to skip
-    skip_folders = ['DiagnosticReports', 'com.apple.', 'CoreSimulator', 'Homebrew']
+    logs_path = Path(HOME) / 'Library' / 'Logs'
     
     try:
-        for log_folder in logs_path.iterdir():
+        candidates = []
+        for log_folder in _list_dir(logs_path):
             if log_folder.is_dir():
                 log_name = log_folder.name.lower()
                 
-                # Skip known system logs
-                if any(log_name.startswith(skip.lower()) or log_name == skip.lower()
-                       for skip in skip_folders):
+                # Skip known system logs (an exact match is also a prefix match)
+                if log_name.startswith(LOGS_SKIP_PREFIXES):
                     continue
                 
                 # Check if this log folder belongs to an installed app
-                is_orphan = True
-                for installed_id in installed_ids:
-                    if log_name in installed_id or installed_id in log_name:
-                        is_orphan = False
-                        break
-                    installed_parts = installed_id.split('.')
-                    if any(part.lower() == log_name for part in installed_parts):
-                        is_orphan = False
-                        break
+                is_orphan = not (installed_ids.within_id(log_name)
+                                 or installed_ids.contains_id(log_name)
+                                 or installed_ids.is_component(log_name))
                 
                 if is_orphan:
-                    size = get_directory_size(str(log_folder))
-                    if size > 1024:  # Only include logs > 1KB
-                        orphans.append(LeftoverItem(
-                            id=f"logs_{log_folder.name}",
-                            path=str(log_folder),
-                            name=log_folder.name,
-                            bundle_id=f"*.{log_folder.name}",
-                            detection_source="logs_scan",
-                            category="Logs",
-                            confidence="low",
-                            hint=f"Log folder for '{log_folder.name}'. No matching app installed. Low confidence - verify before removing.",
-                            size=size,
-                            size_human=human_readable_size(size),
-                            selected=False  # Don't auto-select low confidence items
-                        ))
+                    candidates.append(log_folder)
+        
+        for log_folder, size in _size_candidates(candidates):
+            if size > 1024:  # Only include logs > 1KB
+                yield LeftoverItem(
+                    id=f"logs_{log_folder.name}",
+                    path=log_folder.path,
+                    name=log_folder.name,
+                    bundle_id=f"*.{log_folder.name}",
+                    detection_source="logs_scan",
+                    category="Logs",
+                    confidence="low",
+                    hint=f"Log folder for '{log_folder.name}'. No matching app installed. Low confidence - verify before removing.",
+                    size=size,
+                    size_human=human_readable_size(size),
+                    selected=False  # Don't auto-select low confidence items
+                )
     except:
         pass
-    
-    return orphans
+
+
+# Leftover detectors with the Library folder each one scans
+LEFTOVER_DETECTORS = (
+    ("Containers", detect_container_orphans),
+    ("Group Containers", detect_group_container_orphans),
+    ("Application Support", detect_app_support_orphans),
+    ("Preferences", detect_preference_orphans),
+    ("Launch Agents", detect_launch_agent_orphans),
+    ("Orphan Caches", detect_cache_orphans),
+    ("Logs", detect_logs_orphans),
+)
+
+
+# Known cache locations, built once; scans work on copies of these
+CACHE_LOCATION_TEMPLATES = (
+    CacheLocation(
+        id="user_caches",
+        path=f"{HOME}/Library/Caches",
+        name="User Application Caches",
+        description="Cache files from all your applications",
+        category="System",
+        hint="This folder contains cached data from all applications you use. Apps store temporary files here to speed up loading times.",
+        impact="Apps will need to re-download or regenerate their cached data. Generally safe.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="system_caches",
+        path="/Library/Caches",
+        name="System Application Caches",
+        description="System-wide application caches",
+        category="System",
+        hint="Contains cached data for system-level applications and services.",
+        impact="System apps will regenerate caches as needed. May require admin password.",
+        risk="medium"
+    ),
+    CacheLocation(
+        id="xcode_derived",
+        path=f"{HOME}/Library/Developer/Xcode/DerivedData",
+        name="Xcode DerivedData",
+        description="Xcode build intermediates and indexes",
+        category="Developer",
+        hint="Contains all build products, indexes, and logs from Xcode projects.",
+        impact="Next build will take longer as Xcode rebuilds everything from scratch.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="xcode_archives",
+        path=f"{HOME}/Library/Developer/Xcode/Archives",
+        name="Xcode Archives",
+        description="App Store submission archives",
+        category="Developer",
+        hint="Contains archived builds used for App Store submissions.",
+        impact="⚠️ You will lose the ability to symbolicate crash reports from these builds.",
+        risk="high"
+    ),
+    CacheLocation(
+        id="xcode_device_support",
+        path=f"{HOME}/Library/Developer/Xcode/iOS DeviceSupport",
+        name="iOS Device Support",
+        description="Debug symbols for iOS devices",
+        category="Developer",
+        hint="Contains debug symbols for each iOS version you've connected. Often 2-5GB each!",
+        impact="Xcode will re-download symbols when you next connect a device.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="simulator_devices",
+        path=f"{HOME}/Library/Developer/CoreSimulator/Devices",
+        name="iOS Simulator Devices",
+        description="All iOS Simulator instances and data",
+        category="Developer",
+        hint="Contains all simulator devices and their installed apps and data.",
+        impact="⚠️ ALL simulator devices and their app data will be deleted.",
+        risk="high"
+    ),
+    CacheLocation(
+        id="npm_cache",
+        path=f"{HOME}/.npm/_cacache",
+        name="NPM Cache",
+        description="Downloaded NPM packages cache",
+        category="Packages",
+        hint="NPM stores downloaded packages here to avoid re-downloading them.",
+        impact="NPM will re-download packages when needed.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="yarn_cache",
+        path=f"{HOME}/.yarn/cache",
+        name="Yarn Cache",
+        description="Downloaded Yarn packages cache",
+        category="Packages",
+        hint="Yarn's offline cache of all packages.",
+        impact="Yarn will need to re-download packages.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="pip_cache",
+        path=f"{HOME}/.cache/pip",
+        name="Python Pip Cache",
+        description="Downloaded Python packages cache",
+        category="Packages",
+        hint="Pip caches downloaded wheel and source packages here.",
+        impact="Pip will re-download packages when installing.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="pub_cache",
+        path=f"{HOME}/.pub-cache",
+        name="Flutter/Dart Pub Cache",
+        description="Dart and Flutter packages",
+        category="Packages",
+        hint="Contains all Flutter and Dart packages.",
+        impact="Run 'flutter pub get' again after cleaning.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="gradle_cache",
+        path=f"{HOME}/.gradle/caches",
+        name="Gradle Cache",
+        description="Android/Java build cache",
+        category="Packages",
+        hint="Gradle stores downloaded dependencies and build outputs here.",
+        impact="Android/Gradle builds will re-download dependencies.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="cocoapods",
+        path=f"{HOME}/.cocoapods/repos",
+        name="CocoaPods Repos",
+        description="CocoaPods spec repositories",
+        category="Packages",
+        hint="Contains the CocoaPods master spec repo. Can be 1-2GB.",
+        impact="Next 'pod install' will re-clone spec repos.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="safari_cache",
+        path=f"{HOME}/Library/Caches/com.apple.Safari",
+        name="Safari Cache",
+        description="Safari browser cache",
+        category="Browsers",
+        hint="Contains cached web pages, images, scripts from Safari.",
+        impact="Websites will reload fresh content. Login sessions preserved.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="chrome_cache",
+        path=f"{HOME}/Library/Caches/Google/Chrome/Default/Cache",
+        name="Chrome Cache",
+        description="Chrome browser cache",
+        category="Browsers",
+        hint="Chrome's cached web content.",
+        impact="Chrome will re-download web content. Cookies and history preserved.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="firefox_cache",
+        path=f"{HOME}/Library/Caches/Firefox",
+        name="Firefox Cache",
+        description="Firefox browser cache",
+        category="Browsers",
+        hint="Firefox's cached web content.",
+        impact="Firefox will reload content. Login sessions safe.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="vscode_cache",
+        path=f"{HOME}/Library/Application Support/Code/CachedData",
+        name="VS Code Cache",
+        description="Visual Studio Code cached data",
+        category="Applications",
+        hint="VS Code caches extension data and workspace state.",
+        impact="VS Code may take slightly longer to start.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="slack_cache",
+        path=f"{HOME}/Library/Application Support/Slack/Cache",
+        name="Slack Cache",
+        description="Slack cached messages and files",
+        category="Applications",
+        hint="Contains cached messages, files, and images from Slack.",
+        impact="Slack will re-download message history and files.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="discord_cache",
+        path=f"{HOME}/Library/Application Support/discord/Cache",
+        name="Discord Cache",
+        description="Discord cached content",
+        category="Applications",
+        hint="Cached images, videos, and other media from Discord.",
+        impact="Discord will re-download media from channels.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="spotify_cache",
+        path=f"{HOME}/Library/Application Support/Spotify/PersistentCache",
+        name="Spotify Cache",
+        description="Spotify offline music cache",
+        category="Applications",
+        hint="Contains cached and downloaded music for offline playback.",
+        impact="⚠️ Downloaded songs for offline will be removed.",
+        risk="medium"
+    ),
+    CacheLocation(
+        id="docker_data",
+        path=f"{HOME}/Library/Containers/com.docker.docker/Data/vms",
+        name="Docker VM Data",
+        description="Docker Desktop VM disk images",
+        category="Docker",
+        hint="Docker Desktop runs in a VM. This contains all containers and images.",
+        impact="⚠️ ALL Docker images, containers, and volumes will be deleted.",
+        risk="high"
+    ),
+    CacheLocation(
+        id="tmp",
+        path="/tmp",
+        name="System Temp Files",
+        description="Temporary files from running apps",
+        category="Temp",
+        hint="Standard Unix temp directory. Cleared on reboot.",
+        impact="Running apps may lose temporary work. Close apps first.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="user_logs",
+        path=f"{HOME}/Library/Logs",
+        name="User Application Logs",
+        description="Log files from applications",
+        category="Logs",
+        hint="Applications store their log files here for debugging.",
+        impact="Historical logs will be lost. Apps create new logs as needed.",
+        risk="low"
+    ),
+    CacheLocation(
+        id="ios_backups",
+        path=f"{HOME}/Library/Application Support/MobileSync/Backup",
+        name="iOS Device Backups",
+        description="iPhone/iPad local backups",
+        category="Backups",
+        hint="Local backups of iOS devices. Each can be 10-100GB.",
+        impact="⚠️ ALL local device backups will be permanently deleted.",
+        risk="high"
+    ),
+    CacheLocation(
+        id="homebrew_cache",
+        path=f"{HOME}/Library/Caches/Homebrew",
+        name="Homebrew Downloads",
+        description="Downloaded Homebrew packages",
+        category="Packages",
+        hint="Homebrew caches downloaded bottles and source archives.",
+        impact="Homebrew will re-download packages if reinstalled.",
+        risk="low"
+    ),
+)
 
 
 def get_cache_locations() -> List[CacheLocation]:
-    home = get_home()
-    
-    locations = [
-        CacheLocation(
-            id="user_caches",
-            path=f"{home}/Library/Caches",
-            name="User Application Caches",
-            description="Cache files from all your applications",
-            category="System",
-            hint="This folder contains cached data from all applications you use. Apps store temporary files here to speed up loading times.",
-            impact="Apps will need to re-download or regenerate their cached data. Generally safe.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="system_caches",
-            path="/Library/Caches",
-            name="System Application Caches",
-            description="System-wide application caches",
-            category="System",
-            hint="Contains cached data for system-level applications and services.",
-            impact="System apps will regenerate caches as needed. May require admin password.",
-            risk="medium"
-        ),
-        CacheLocation(
-            id="xcode_derived",
-            path=f"{home}/Library/Developer/Xcode/DerivedData",
-            name="Xcode DerivedData",
-            description="Xcode build intermediates and indexes",
-            category="Developer",
-            hint="Contains all build products, indexes, and logs from Xcode projects.",
-            impact="Next build will take longer as Xcode rebuilds everything from scratch.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="xcode_archives",
-            path=f"{home}/Library/Developer/Xcode/Archives",
-            name="Xcode Archives",
-            description="App Store submission archives",
-            category="Developer",
-            hint="Contains archived builds used for App Store submissions.",
-            impact="⚠️ You will lose the ability to symbolicate crash reports from these builds.",
-            risk="high"
-        ),
-        CacheLocation(
-            id="xcode_device_support",
-            path=f"{home}/Library/Developer/Xcode/iOS DeviceSupport",
-            name="iOS Device Support",
-            description="Debug symbols for iOS devices",
-            category="Developer",
-            hint="Contains debug symbols for each iOS version you've connected. Often 2-5GB each!",
-            impact="Xcode will re-download symbols when you next connect a device.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="simulator_devices",
-            path=f"{home}/Library/Developer/CoreSimulator/Devices",
-            name="iOS Simulator Devices",
-            description="All iOS Simulator instances and data",
-            category="Developer",
-            hint="Contains all simulator devices and their installed apps and data.",
-            impact="⚠️ ALL simulator devices and their app data will be deleted.",
-            risk="high"
-        ),
-        CacheLocation(
-            id="npm_cache",
-            path=f"{home}/.npm/_cacache",
-            name="NPM Cache",
-            description="Downloaded NPM packages cache",
-            category="Packages",
-            hint="NPM stores downloaded packages here to avoid re-downloading them.",
-            impact="NPM will re-download packages when needed.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="yarn_cache",
-            path=f"{home}/.yarn/cache",
-            name="Yarn Cache",
-            description="Downloaded Yarn packages cache",
-            category="Packages",
-            hint="Yarn's offline cache of all packages.",
-            impact="Yarn will need to re-download packages.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="pip_cache",
-            path=f"{home}/.cache/pip",
-            name="Python Pip Cache",
-            description="Downloaded Python packages cache",
-            category="Packages",
-            hint="Pip caches downloaded wheel and source packages here.",
-            impact="Pip will re-download packages when installing.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="pub_cache",
-            path=f"{home}/.pub-cache",
-            name="Flutter/Dart Pub Cache",
-            description="Dart and Flutter packages",
-            category="Packages",
-            hint="Contains all Flutter and Dart packages.",
-            impact="Run 'flutter pub get' again after cleaning.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="gradle_cache",
-            path=f"{home}/.gradle/caches",
-            name="Gradle Cache",
-            description="Android/Java build cache",
-            category="Packages",
-            hint="Gradle stores downloaded dependencies and build outputs here.",
-            impact="Android/Gradle builds will re-download dependencies.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="cocoapods",
-            path=f"{home}/.cocoapods/repos",
-            name="CocoaPods Repos",
-            description="CocoaPods spec repositories",
-            category="Packages",
-            hint="Contains the CocoaPods master spec repo. Can be 1-2GB.",
-            impact="Next 'pod install' will re-clone spec repos.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="safari_cache",
-            path=f"{home}/Library/Caches/com.apple.Safari",
-            name="Safari Cache",
-            description="Safari browser cache",
-            category="Browsers",
-            hint="Contains cached web pages, images, scripts from Safari.",
-            impact="Websites will reload fresh content. Login sessions preserved.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="chrome_cache",
-            path=f"{home}/Library/Caches/Google/Chrome/Default/Cache",
-            name="Chrome Cache",
-            description="Chrome browser cache",
-            category="Browsers",
-            hint="Chrome's cached web content.",
-            impact="Chrome will re-download web content. Cookies and history preserved.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="firefox_cache",
-            path=f"{home}/Library/Caches/Firefox",
-            name="Firefox Cache",
-            description="Firefox browser cache",
-            category="Browsers",
-            hint="Firefox's cached web content.",
-            impact="Firefox will reload content. Login sessions safe.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="vscode_cache",
-            path=f"{home}/Library/Application Support/Code/CachedData",
-            name="VS Code Cache",
-            description="Visual Studio Code cached data",
-            category="Applications",
-            hint="VS Code caches extension data and workspace state.",
-            impact="VS Code may take slightly longer to start.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="slack_cache",
-            path=f"{home}/Library/Application Support/Slack/Cache",
-            name="Slack Cache",
-            description="Slack cached messages and files",
-            category="Applications",
-            hint="Contains cached messages, files, and images from Slack.",
-            impact="Slack will re-download message history and files.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="discord_cache",
-            path=f"{home}/Library/Application Support/discord/Cache",
-            name="Discord Cache",
-            description="Discord cached content",
-            category="Applications",
-            hint="Cached images, videos, and other media from Discord.",
-            impact="Discord will re-download media from channels.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="spotify_cache",
-            path=f"{home}/Library/Application Support/Spotify/PersistentCache",
-            name="Spotify Cache",
-            description="Spotify offline music cache",
-            category="Applications",
-            hint="Contains cached and downloaded music for offline playback.",
-            impact="⚠️ Downloaded songs for offline will be removed.",
-            risk="medium"
-        ),
-        CacheLocation(
-            id="docker_data",
-            path=f"{home}/Library/Containers/com.docker.docker/Data/vms",
-            name="Docker VM Data",
-            description="Docker Desktop VM disk images",
-            category="Docker",
-            hint="Docker Desktop runs in a VM. This contains all containers and images.",
-            impact="⚠️ ALL Docker images, containers, and volumes will be deleted.",
-            risk="high"
-        ),
-        CacheLocation(
-            id="tmp",
-            path="/tmp",
-            name="System Temp Files",
-            description="Temporary files from running apps",
-            category="Temp",
-            hint="Standard Unix temp directory. Cleared on reboot.",
-            impact="Running apps may lose temporary work. Close apps first.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="user_logs",
-            path=f"{home}/Library/Logs",
-            name="User Application Logs",
-            description="Log files from applications",
-            category="Logs",
-            hint="Applications store their log files here for debugging.",
-            impact="Historical logs will be lost. Apps create new logs as needed.",
-            risk="low"
-        ),
-        CacheLocation(
-            id="ios_backups",
-            path=f"{home}/Library/Application Support/MobileSync/Backup",
-            name="iOS Device Backups",
-            description="iPhone/iPad local backups",
-            category="Backups",
-            hint="Local backups of iOS devices. Each can be 10-100GB.",
-            impact="⚠️ ALL local device backups will be permanently deleted.",
-            risk="high"
-        ),
-        CacheLocation(
-            id="homebrew_cache",
-            path=f"{home}/Library/Caches/Homebrew",
-            name="Homebrew Downloads",
-            description="Downloaded Homebrew packages",
-            category="Packages",
-            hint="Homebrew caches downloaded bottles and source archives.",
-            impact="Homebrew will re-download packages if reinstalled.",
-            risk="low"
-        ),
-    ]
-    
-    return locations
+    # Scans fill in size and selection, so hand out fresh shallow copies
+    return [copy.copy(loc) for loc in CACHE_LOCATION_TEMPLATES]
+
+
+def find_nested_locations(locations: List[CacheLocation]) -> Dict[str, List[CacheLocation]]:
+    """Map each location id to the locations directly inside its tree.
+
+    e.g. Safari's cache lives inside ~/Library/Caches, so the parent walk
+    prunes it and reuses the child's size instead of walking it twice.
+    """
+    nested = {}
+    for parent in locations:
+        prefix = parent.path.rstrip('/') + '/'
+        inside = [loc for loc in locations if loc.path.startswith(prefix)]
+        direct = [
+            loc for loc in inside
+            if not any(loc.path.startswith(other.path.rstrip('/') + '/') for other in inside)
+        ]
+        if direct:
+            nested[parent.id] = direct
+    return nested
+
+
+# Finder drops these into any folder it displays; on their own they are not content
+IGNORED_ENTRY_NAMES = frozenset({'.DS_Store'})
+
+
+def _peek_entries(path: str, limit: int) -> List[os.DirEntry]:
+    """Return up to `limit` entries of path, ignoring Finder metadata files.
+
+    Lets callers tell empty folders apart from ones worth walking after
+    reading only the start of the listing. Raises OSError like scandir.
+    """
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name not in IGNORED_ENTRY_NAMES:
+                entries.append(entry)
+                if len(entries) >= limit:
+                    break
+    return entries
+
+
+def scan_location(loc: CacheLocation, children: List[CacheLocation] = ()) -> CacheLocation:
+    """Fill in existence and size for a single cache location.
+
+    Subtrees belonging to `children` are left out of the walk; their sizes
+    are added back once they have been scanned on their own.
+    """
+    try:
+        st = os.stat(loc.path)
+        loc.exists = True
+        if stat.S_ISDIR(st.st_mode) and not _peek_entries(loc.path, 1):
+            return loc
+    except OSError:
+        return loc
+    loc.size, loc.partial = measure_directory_size(
+        loc.path, frozenset(child.path for child in children), st
+    )
+    loc.size_human = human_readable_size(loc.size)
+    return loc
+
+
+def _fast_rmtree(path: str, dir_fd: int = None):
+    """Delete a directory tree, like shutil.rmtree without an error handler.
+
+    Every directory is opened with O_NOFOLLOW and its entries are removed
+    relative to that descriptor, so a symlink swapped in mid-delete can't
+    redirect us outside the tree. The file type comes from the dirent, so
+    plain files are unlinked without any stat() call.
+    """
+    fd = os.open(path, os.O_RDONLY | O_DIRECTORY | O_NOFOLLOW, dir_fd=dir_fd)
+    try:
+        # List first; removing entries mid-readdir can make macOS skip some
+        with os.scandir(fd) as it:
+            entries = list(it)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.name, fd)
+            else:
+                os.unlink(entry.name, dir_fd=fd)
+    finally:
+        os.close(fd)
+    os.rmdir(path, dir_fd=dir_fd)
 
 
 # Routes
+# The panel shell has no per-request template state; render it once and
+# serve the bytes, everything dynamic is fetched from the JSON API.
+with app.app_context():
+    INDEX_HTML = render_template('app.html').encode('utf-8')
+
+
 @app.route('/')
 def index():
-    return render_template('app.html')
+    return Response(INDEX_HTML, mimetype='text/html')
 
 
 @app.route('/assets/<path:filename>')
@@ -841,54 +1630,94 @@ def serve_assets(filename):
 
 @app.route('/api/scan', methods=['POST'])
 def start_scan():
-    global scan_results, scan_in_progress, scan_complete, scan_progress
-    
-    if scan_in_progress:
-        return jsonify({"status": "already_scanning"})
-    
-    scan_in_progress = True
-    scan_complete = False
-    scan_results = []
-    scan_progress = {"current": 0, "total": 0, "percent": 0, "current_location": "", "found_count": 0, "total_size": 0}
+    if not scan_state.try_start(ScanSnapshot()):
+        return ojson({"status": "already_scanning"})
     
     def do_scan():
-        global scan_results, scan_in_progress, scan_complete, scan_progress
         locations = get_cache_locations()
         results = []
+        try:
+            total_locations = len(locations)
+            scan_state.update(total=total_locations + 1)
         
-        total_locations = len(locations)
-        scan_progress["total"] = total_locations + 1
+            nested = find_nested_locations(locations)
+            found_count = 0
+            running_total = 0
         
-        for i, loc in enumerate(locations):
-            scan_progress["current"] = i + 1
-            scan_progress["current_location"] = loc.name
-            scan_progress["percent"] = int((i / (total_locations + 1)) * 100)
-            
-            path = Path(loc.path)
-            if path.exists():
-                loc.exists = True
-                loc.size = get_directory_size(loc.path)
-                loc.size_human = human_readable_size(loc.size)
+            # Sizing is syscall-bound, so locations are walked concurrently
+            with ThreadPoolExecutor(max_workers=walk_workers(get_home(), SCAN_WORKERS)) as pool:
+                futures = [pool.submit(scan_location, loc, nested.get(loc.id, ())) for loc in locations]
+                for i, future in enumerate(as_completed(futures)):
+                    loc = future.result()
+                    if loc.size > 0:
+                        found_count += 1
+                        running_total += loc.size
+                    scan_state.update(
+                        current=i + 1,
+                        current_location=loc.name,
+                        percent=int(((i + 1) / (total_locations + 1)) * 100),
+                        found_count=found_count,
+                        total_size=running_total
+                    )
+        
+            # Add pruned subtrees back into their parents, innermost first
+            for loc in sorted(locations, key=lambda l: len(l.path), reverse=True):
+                children = nested.get(loc.id)
+                if children and loc.exists:
+                    loc.size += sum(child.size for child in children)
+                    loc.partial = loc.partial or any(child.partial for child in children)
+                    loc.size_human = human_readable_size(loc.size)
+            for loc in locations:
                 if loc.size > 0:
                     loc.selected = True
                     results.append(loc)
-                    scan_progress["found_count"] = len(results)
-                    scan_progress["total_size"] = sum(r.size for r in results)
+            # Parents now include their children, so recount once at the phase boundary
+            running_total = sum(r.size for r in results)
+            scan_state.update(found_count=len(results), total_size=running_total)
+        
+            # Scan container caches
+            scan_state.update(current_location="Container Apps")
+            home = get_home()
+            containers_path = Path(f"{home}/Library/Containers")
+            cache_paths = []
+            # Containers can share one Caches folder through a symlink; size it once
+            seen = set()
+            try:
+                for container in _list_dir(containers_path):
+                    cache_path = os.path.join(container.path, "Data", "Library", "Caches")
+                    # Peek at the first two entries: most container caches are empty
+                    # or hold a single file, and neither needs a tree walk
+                    try:
+                        st = os.stat(cache_path)
+                        key = (st.st_dev, st.st_ino)
+                        if key in seen or not stat.S_ISDIR(st.st_mode):
+                            continue
+                        seen.add(key)
+                        entries = _peek_entries(cache_path, 2)
+                        if not entries:
+                            continue
+                        known_size = None
+                        if len(entries) == 1 and entries[0].is_file(follow_symlinks=False):
+                            known_size = entries[0].stat(follow_symlinks=False).st_blocks * 512
+                    except OSError:
+                        continue
+                    cache_paths.append((container.name, cache_path, st, known_size))
+            except OSError:
+                pass
         
-        # Scan container caches
-        scan_progress["current_location"] = "Container Apps"
-        home = get_home()
-        containers_path = Path(f"{home}/Library/Containers")
-        if containers_path.exists():
-            for container in containers_path.iterdir():
-                cache_path = container / "Data" / "Library" / "Caches"
-                if cache_path.exists() and cache_path.is_dir():
-                    app_name = container.name.split('.')[-1] if '.' in container.name else container.name
-                    size = get_directory_size(str(cache_path))
+            with ThreadPoolExecutor(max_workers=walk_workers(get_home(), CONTAINER_CACHE_WORKERS)) as pool:
+                futures = [
+                    pool.submit(measure_directory_size, cache_path, frozenset(), st)
+                    if known_size is None else None
+                    for _, cache_path, st, known_size in cache_paths
+                ]
+                for (container_name, cache_path, _, known_size), future in zip(cache_paths, futures):
+                    app_name = container_name.split('.')[-1] if '.' in container_name else container_name
+                    size, partial = (known_size, False) if future is None else future.result()
                     if size > 0:
                         results.append(CacheLocation(
                             id=f"container_{app_name}",
-                            path=str(cache_path),
+                            path=cache_path,
                             name=f"{app_name} Cache",
                             description=f"Sandboxed app cache for {app_name}",
                             category="Containers",
@@ -898,81 +1727,167 @@ def start_scan():
                             size=size,
                             size_human=human_readable_size(size),
                             selected=True,
-                            exists=True
+                            exists=True,
+                            partial=partial
                         ))
-                        scan_progress["found_count"] = len(results)
-                        scan_progress["total_size"] = sum(r.size for r in results)
+                        running_total += size
+                        scan_state.update(found_count=len(results), total_size=running_total)
         
-        scan_progress["percent"] = 100
-        scan_progress["current_location"] = "Complete"
+            scan_state.update(percent=100, current_location="Complete")
         
-        results.sort(key=lambda x: x.size, reverse=True)
-        scan_results = results
-        scan_in_progress = False
-        scan_complete = True
+            results.sort(key=attrgetter('size'), reverse=True)
+        finally:
+            # Always publish, even after an error, so the UI stops waiting
+            scan_state.finish(results)
     
     thread = threading.Thread(target=do_scan)
     thread.start()
     
-    return jsonify({"status": "started"})
+    return ojson({"status": "started"})
 
 
 @app.route('/api/scan/status')
 def scan_status():
-    return jsonify({
-        "in_progress": scan_in_progress,
-        "complete": scan_complete,
-        "count": len(scan_results),
-        "current_location": scan_progress.get("current_location", ""),
-        "progress": scan_progress
-    })
+    return ojson(scan_state.status())
+
+
+# Server-sent progress: at most one event per interval, and a repeat of the
+# current status after the keepalive period so idle proxies keep the stream
+STREAM_MIN_INTERVAL = 0.25
+STREAM_KEEPALIVE = 15.0
+
+
+def stream_status(state: ScanState) -> Response:
+    """Push state.status() as server-sent events until the scan finishes."""
+    def generate():
+        version = None
+        while True:
+            version = state.wait_for_change(version, STREAM_KEEPALIVE)
+            status = state.status()
+            yield b"data: " + encode_json(status) + b"\n\n"
+            if not status["in_progress"]:
+                return
+            time.sleep(STREAM_MIN_INTERVAL)
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
+
+
+@app.route('/api/scan/stream')
+def scan_stream():
+    return stream_status(scan_state)
 
 
 @app.route('/api/locations')
 def get_locations():
-    return jsonify([asdict(loc) for loc in scan_results])
+    return app.response_class(scan_state.results_json, mimetype='application/json')
 
 
 @app.route('/api/clean', methods=['POST'])
 def clean_locations():
     data = request.json
-    ids_to_clean = data.get('ids', [])
+    # Dedupe while keeping the order the UI sent
+    ids_to_clean = dict.fromkeys(data.get('ids', []))
     
-    results = []
-    for loc in scan_results:
-        if loc.id in ids_to_clean:
-            success = False
-            message = ""
-            try:
-                path = Path(loc.path)
-                if path.is_dir():
-                    for item in path.iterdir():
-                        try:
-                            if item.is_dir():
-                                shutil.rmtree(item)
-                            else:
-                                item.unlink()
-                        except:
-                            pass
-                    success = True
-                    message = "Cleaned"
-                elif path.is_file():
-                    path.unlink()
-                    success = True
-                    message = "Deleted"
-            except PermissionError:
-                message = "Permission denied"
-            except Exception as e:
-                message = str(e)
-            
-            results.append({
-                "id": loc.id,
-                "name": loc.name,
-                "success": success,
-                "message": message
-            })
+    by_id = scan_state.by_id
+    locations = [loc for loc_id in ids_to_clean for loc in by_id.get(loc_id, ())]
+    results = clean_by_volume(locations, _clean_location)
     
-    return jsonify({"results": results})
+    return ojson({"results": results})
+
+
+def clean_by_volume(items: list, clean) -> List[Dict[str, Any]]:
+    """Run clean(item) for every item, returning results in item order.
+
+    Deleting is unlink-latency bound, so different volumes are cleaned
+    concurrently, with at most CLEAN_WORKERS_PER_VOLUME threads each.
+    """
+    by_volume = {}
+    for index, item in enumerate(items):
+        try:
+            dev = os.lstat(item.path).st_dev
+        except OSError:
+            dev = None
+        by_volume.setdefault(dev, []).append(index)
+    # Each lane is a list of item indexes cleaned one after another
+    lanes = [indexes[n::CLEAN_WORKERS_PER_VOLUME]
+             for indexes in by_volume.values()
+             for n in range(min(CLEAN_WORKERS_PER_VOLUME, len(indexes)))]
+
+    def run_lane(indexes):
+        return [(i, clean(items[i])) for i in indexes]
+
+    results = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=CLEAN_WORKERS) as pool:
+        for lane in pool.map(run_lane, lanes):
+            for i, result in lane:
+                results[i] = result
+    return results
+
+
+# Big locations are emptied by find(1), whose depth-first unlinkat loop
+# runs without any per-file interpreter work; smaller ones aren't worth a fork
+FIND_DELETE_THRESHOLD = 100 * 1024 * 1024
+FIND_DELETE_TIMEOUT = 300
+
+
+def _find_delete_contents(path: str) -> bool:
+    """Delete everything inside path with `find -delete`; False if that failed.
+
+    find never follows symlinks, not even a symlinked starting point, so
+    path must already be resolved.
+    """
+    try:
+        result = subprocess.run(['find', path, '-mindepth', '1', '-delete'],
+                                capture_output=True, timeout=FIND_DELETE_TIMEOUT)
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"Warning: find -delete failed for {path}: {e}")
+        return False
+    if result.returncode != 0:
+        error = result.stderr.decode('utf-8', 'replace').strip().splitlines()
+        print(f"Warning: find -delete failed for {path}: {error[0] if error else result.returncode}")
+        return False
+    return True
+
+
+def _clean_location(loc: CacheLocation) -> Dict[str, Any]:
+    """Empty one cache location, keeping the folder itself."""
+    success = False
+    message = ""
+    try:
+        path = Path(loc.path)
+        if path.is_dir():
+            # If find fails, the per-item pass removes whatever it left
+            if not (loc.size > FIND_DELETE_THRESHOLD
+                    and _find_delete_contents(os.path.realpath(loc.path))):
+                for item in path.iterdir():
+                    try:
+                        if item.is_dir():
+                            _fast_rmtree(str(item))
+                        else:
+                            item.unlink()
+                    except:
+                        pass
+            if next(path.iterdir(), None) is None:
+                success = True
+                message = "Cleaned"
+            else:
+                message = "Some items could not be removed"
+        elif path.is_file():
+            path.unlink()
+            success = True
+            message = "Deleted"
+    except PermissionError:
+        message = "Permission denied"
+    except Exception as e:
+        message = str(e)
+    
+    return {
+        "id": loc.id,
+        "name": loc.name,
+        "success": success,
+        "message": message
+    }
 
 
 # ============================================================================
@@ -982,164 +1897,174 @@ def clean_locations():
 @app.route('/api/scan/leftovers', methods=['POST'])
 def start_leftover_scan():
     """Start scanning for uninstalled application leftovers."""
-    global leftover_results, leftover_scan_in_progress, leftover_scan_complete, leftover_scan_progress
-    
-    if leftover_scan_in_progress:
-        return jsonify({"status": "already_scanning"})
-    
-    leftover_scan_in_progress = True
-    leftover_scan_complete = False
-    leftover_results = []
-    leftover_scan_progress = {
-        "current": 0, "total": 7, "percent": 0,
-        "current_location": "Initializing...",
-        "found_count": 0, "total_size": 0
-    }
+    initial = ScanSnapshot(total=1 + len(LEFTOVER_DETECTORS), current_location="Initializing...")
+    if not leftover_state.try_start(initial):
+        return ojson({"status": "already_scanning"})
     
     def do_leftover_scan():
-        global leftover_results, leftover_scan_in_progress, leftover_scan_complete, leftover_scan_progress
-        
         results = []
+        try:
+            # Step 1: Get installed bundle IDs
+            leftover_state.update(
+                current_location="Scanning installed applications...",
+                current=1,
+                percent=10
+            )
         
-        # Step 1: Get installed bundle IDs
-        leftover_scan_progress["current_location"] = "Scanning installed applications..."
-        leftover_scan_progress["current"] = 1
-        leftover_scan_progress["percent"] = 10
-        
-        installed_ids = get_installed_bundle_ids()
-        
-        # Step 2: Scan Containers
-        leftover_scan_progress["current_location"] = "Scanning Containers..."
-        leftover_scan_progress["current"] = 2
-        leftover_scan_progress["percent"] = 25
-        results.extend(detect_container_orphans(installed_ids))
-        leftover_scan_progress["found_count"] = len(results)
-        leftover_scan_progress["total_size"] = sum(r.size for r in results)
-        
-        # Step 3: Scan Group Containers
-        leftover_scan_progress["current_location"] = "Scanning Group Containers..."
-        leftover_scan_progress["current"] = 3
-        leftover_scan_progress["percent"] = 40
-        results.extend(detect_group_container_orphans(installed_ids))
-        leftover_scan_progress["found_count"] = len(results)
-        leftover_scan_progress["total_size"] = sum(r.size for r in results)
+            installed_ids = InstalledIdIndex(get_installed_bundle_ids())
         
-        # Step 4: Scan Application Support
-        leftover_scan_progress["current_location"] = "Scanning Application Support..."
-        leftover_scan_progress["current"] = 4
-        leftover_scan_progress["percent"] = 55
-        results.extend(detect_app_support_orphans(installed_ids))
-        leftover_scan_progress["found_count"] = len(results)
-        leftover_scan_progress["total_size"] = sum(r.size for r in results)
+            # Step 2: Run the detectors concurrently; each reads its own Library folder
+            leftover_state.update(
+                current_location="Scanning Library folders...",
+                current=2,
+                percent=20
+            )
+            found = [[] for _ in LEFTOVER_DETECTORS]
+            completed = itertools.count(1)
         
-        # Step 5: Scan Preferences
-        leftover_scan_progress["current_location"] = "Scanning Preferences..."
-        leftover_scan_progress["current"] = 5
-        leftover_scan_progress["percent"] = 70
-        results.extend(detect_preference_orphans(installed_ids))
-        leftover_scan_progress["found_count"] = len(results)
-        leftover_scan_progress["total_size"] = sum(r.size for r in results)
+            def run_detector(i):
+                label, detector = LEFTOVER_DETECTORS[i]
+                # Items are published one at a time so the UI sees them arrive;
+                # each bucket is only ever touched by its own worker
+                for item in detector(installed_ids):
+                    found[i].append(item)
+                    leftover_state.add_found(item.size)
+                done = next(completed)
+                leftover_state.update(
+                    current_location=f"Done: {label}",
+                    current=1 + done,
+                    percent=20 + 80 * done // len(LEFTOVER_DETECTORS)
+                )
         
-        # Step 6: Scan Launch Agents
-        leftover_scan_progress["current_location"] = "Scanning Launch Agents..."
-        leftover_scan_progress["current"] = 6
-        leftover_scan_progress["percent"] = 85
-        results.extend(detect_launch_agent_orphans(installed_ids))
-        leftover_scan_progress["found_count"] = len(results)
-        leftover_scan_progress["total_size"] = sum(r.size for r in results)
+            with ThreadPoolExecutor(max_workers=walk_workers(get_home(), LEFTOVER_WORKERS)) as executor:
+                for future in [executor.submit(run_detector, i) for i in range(len(LEFTOVER_DETECTORS))]:
+                    future.result()
         
-        # Step 7: Scan Caches (orphan caches only)
-        leftover_scan_progress["current_location"] = "Scanning Orphan Caches..."
-        leftover_scan_progress["current"] = 7
-        leftover_scan_progress["percent"] = 95
-        results.extend(detect_cache_orphans(installed_ids))
-        leftover_scan_progress["found_count"] = len(results)
-        leftover_scan_progress["total_size"] = sum(r.size for r in results)
+            # Keep detector order so equal-size items sort the same every scan
+            for items in found:
+                results.extend(items)
         
-        # Done
-        leftover_scan_progress["percent"] = 100
-        leftover_scan_progress["current_location"] = "Complete"
+            # Done
+            leftover_state.update(percent=100, current_location="Complete")
         
-        # Sort by size (largest first)
-        results.sort(key=lambda x: x.size, reverse=True)
+            # Sort by size (largest first)
+            results.sort(key=attrgetter('size'), reverse=True)
         
-        leftover_results = results
-        leftover_scan_in_progress = False
-        leftover_scan_complete = True
+        finally:
+            # Always publish, even after an error, so the UI stops waiting
+            leftover_state.finish(results)
     
     thread = threading.Thread(target=do_leftover_scan)
     thread.start()
     
-    return jsonify({"status": "started"})
+    return ojson({"status": "started"})
 
 
 @app.route('/api/scan/leftovers/status')
 def leftover_scan_status():
     """Get the status of the leftover scan."""
-    return jsonify({
-        "in_progress": leftover_scan_in_progress,
-        "complete": leftover_scan_complete,
-        "count": len(leftover_results),
-        "current_location": leftover_scan_progress.get("current_location", ""),
-        "progress": leftover_scan_progress
-    })
+    return ojson(leftover_state.status())
+
+
+@app.route('/api/scan/leftovers/stream')
+def leftover_scan_stream():
+    """Stream the status of the leftover scan."""
+    return stream_status(leftover_state)
 
 
 @app.route('/api/leftovers')
 def get_leftovers():
     """Return detected leftover items."""
-    return jsonify([asdict(item) for item in leftover_results])
+    return app.response_class(leftover_state.results_json, mimetype='application/json')
 
 
 @app.route('/api/clean/leftovers', methods=['POST'])
 def clean_leftovers():
     """Clean selected leftover items."""
     data = request.json
-    ids_to_clean = data.get('ids', [])
+    ids_to_clean = dict.fromkeys(data.get('ids', []))
     
-    results = []
-    for item in leftover_results:
-        if item.id in ids_to_clean:
-            success = False
-            message = ""
-            try:
-                path = Path(item.path)
-                if path.is_dir():
-                    shutil.rmtree(path)
-                    success = True
-                    message = "Deleted folder"
-                elif path.is_file():
-                    path.unlink()
-                    success = True
-                    message = "Deleted file"
-            except PermissionError:
-                message = "Permission denied"
-            except Exception as e:
-                message = str(e)
-            
-            results.append({
-                "id": item.id,
-                "name": item.name,
-                "success": success,
-                "message": message
-            })
+    by_id = leftover_state.by_id
+    items = [item for item_id in ids_to_clean for item in by_id.get(item_id, ())]
+    results = clean_by_volume(items, _clean_leftover)
     
-    return jsonify({"results": results})
+    return ojson({"results": results})
+
+
+def _clean_leftover(item: LeftoverItem) -> Dict[str, Any]:
+    """Delete one leftover file or folder."""
+    success = False
+    message = ""
+    try:
+        path = Path(item.path)
+        if path.is_dir():
+            _fast_rmtree(str(path))
+            success = True
+            message = "Deleted folder"
+        elif path.is_file():
+            path.unlink()
+            success = True
+            message = "Deleted file"
+    except PermissionError:
+        message = "Permission denied"
+    except Exception as e:
+        message = str(e)
+    
+    return {
+        "id": item.id,
+        "name": item.name,
+        "success": success,
+        "message": message
+    }
 
 
 @app.route('/api/installed-apps')
 def get_installed_apps_list():
     """Return list of currently installed application bundle IDs (for debugging)."""
     bundle_ids = get_installed_bundle_ids()
-    return jsonify({
+    return ojson({
         "count": len(bundle_ids),
         "bundle_ids": sorted(list(bundle_ids))
     })
 
 
 # System monitoring endpoints
-@app.route('/api/system/stats')
-def system_stats():
+# These never change while the panel runs, and the dashboard polls stats
+# every couple of seconds, so read them once
+CPU_COUNT = psutil.cpu_count() if PSUTIL_AVAILABLE else 0
+MEM_TOTAL = psutil.virtual_memory().total if PSUTIL_AVAILABLE else 0
+MEM_TOTAL_HUMAN = human_readable_size(MEM_TOTAL)
+try:
+    BOOT_TIME = psutil.boot_time() if PSUTIL_AVAILABLE else None
+except Exception:
+    BOOT_TIME = None
+
+# Last whole-second CPU reading, kept fresh by a background sampler so
+# stats requests never sleep inside cpu_percent. None until the first
+# reading is in, so the UI shows no value rather than a false 0%.
+_last_cpu_percent = None
+_cpu_sampler_started = False
+_cpu_sampler_lock = threading.Lock()
+
+
+def _cpu_sampler():
+    global _last_cpu_percent
+    while True:
+        _last_cpu_percent = psutil.cpu_percent(interval=1.0)
+
+
+def current_cpu_percent() -> Optional[float]:
+    """Latest CPU usage, or None before the first reading; starts the sampler on first use."""
+    global _cpu_sampler_started
+    if not _cpu_sampler_started:
+        with _cpu_sampler_lock:
+            if not _cpu_sampler_started:
+                threading.Thread(target=_cpu_sampler, daemon=True).start()
+                _cpu_sampler_started = True
+    return _last_cpu_percent
+
+
+def collect_system_stats() -> Dict[str, Any]:
     stats = {
         "cpu_percent": 0,
         "cpu_count": 0,
@@ -1150,16 +2075,16 @@ def system_stats():
     }
     
     if PSUTIL_AVAILABLE:
-        stats["cpu_percent"] = psutil.cpu_percent(interval=0.1)
-        stats["cpu_count"] = psutil.cpu_count()
+        stats["cpu_percent"] = current_cpu_percent()
+        stats["cpu_count"] = CPU_COUNT
         
         mem = psutil.virtual_memory()
         stats["memory"] = {
-            "total": mem.total,
+            "total": MEM_TOTAL,
             "used": mem.used,
             "free": mem.available,
             "percent": mem.percent,
-            "total_human": human_readable_size(mem.total),
+            "total_human": MEM_TOTAL_HUMAN,
             "used_human": human_readable_size(mem.used),
             "free_human": human_readable_size(mem.available)
         }
@@ -1183,9 +2108,8 @@ def system_stats():
             "recv_human": human_readable_size(net.bytes_recv)
         }
         
-        try:
-            boot_time = psutil.boot_time()
-            uptime_seconds = time.time() - boot_time
+        if BOOT_TIME is not None:
+            uptime_seconds = time.time() - BOOT_TIME
             days, remainder = divmod(int(uptime_seconds), 86400)
             hours, remainder = divmod(remainder, 3600)
             minutes, _ = divmod(remainder, 60)
@@ -1195,79 +2119,117 @@ def system_stats():
                 stats["uptime"] = f"{hours}h {minutes}m"
             else:
                 stats["uptime"] = f"{minutes}m"
-        except:
-            pass
     else:
-        # Fallback for disk
+        # Fallback for disk: the same numbers df prints, without spawning it
         try:
-            result = subprocess.run(['df', '-k', '/'], capture_output=True, text=True)
-            lines = result.stdout.strip().split('\n')
-            if len(lines) >= 2:
-                parts = lines[1].split()
-                total = int(parts[1]) * 1024
-                used = int(parts[2]) * 1024
-                free = int(parts[3]) * 1024
-                percent = int(parts[4].replace('%', ''))
-                stats["disk"] = {
-                    "total": total, "used": used, "free": free, "percent": percent,
-                    "total_human": human_readable_size(total),
-                    "used_human": human_readable_size(used),
-                    "free_human": human_readable_size(free)
-                }
-        except:
+            sv = os.statvfs('/')
+            total = sv.f_blocks * sv.f_frsize
+            used = (sv.f_blocks - sv.f_bfree) * sv.f_frsize
+            free = sv.f_bavail * sv.f_frsize
+            percent = -(-used * 100 // (used + free)) if used + free else 0
+            stats["disk"] = {
+                "total": total, "used": used, "free": free, "percent": percent,
+                "total_human": human_readable_size(total),
+                "used_human": human_readable_size(used),
+                "free_human": human_readable_size(free)
+            }
+        except OSError:
             pass
     
-    return jsonify(stats)
+    return stats
+
+
+def _process_entry(proc: tuple) -> Dict[str, Any]:
+    cpu, rss, pid, name = proc
+    return {
+        "pid": pid,
+        "name": name,
+        "cpu_percent": round(cpu, 1),
+        # rss / total, derived rather than having psutil query memory again
+        "memory_percent": round(rss * 100.0 / MEM_TOTAL, 1) if rss else 0,
+        "memory": rss,
+        "memory_human": human_readable_size(rss)
+    }
 
 
-@app.route('/api/system/processes')
-def get_top_processes():
+def collect_top_processes() -> Dict[str, list]:
     processes = {"by_cpu": [], "by_memory": []}
     
     if PSUTIL_AVAILABLE:
         try:
+            # Collect plain (cpu, rss, pid, name) tuples and only build the
+            # response dicts for the processes that make either top list
             procs = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'memory_info']):
-                try:
-                    pinfo = proc.info
-                    if pinfo['cpu_percent'] is not None:
-                        procs.append({
-                            "pid": pinfo['pid'],
-                            "name": pinfo['name'],
-                            "cpu_percent": round(pinfo['cpu_percent'], 1),
-                            "memory_percent": round(pinfo['memory_percent'], 1) if pinfo['memory_percent'] else 0,
-                            "memory": pinfo['memory_info'].rss if pinfo['memory_info'] else 0,
-                            "memory_human": human_readable_size(pinfo['memory_info'].rss if pinfo['memory_info'] else 0)
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
+                pinfo = proc.info
+                if pinfo['cpu_percent'] is not None:
+                    rss = pinfo['memory_info'].rss if pinfo['memory_info'] else 0
+                    procs.append((pinfo['cpu_percent'], rss, pinfo['pid'], pinfo['name']))
             
-            processes["by_cpu"] = sorted(procs, key=lambda x: x['cpu_percent'], reverse=True)[:15]
-            processes["by_memory"] = sorted(procs, key=lambda x: x['memory'], reverse=True)[:15]
+            processes["by_cpu"] = [_process_entry(p) for p in heapq.nlargest(15, procs, key=itemgetter(0))]
+            processes["by_memory"] = [_process_entry(p) for p in heapq.nlargest(15, procs, key=itemgetter(1))]
         except:
             pass
     
-    return jsonify(processes)
+    return processes
+
+
+@app.route('/api/system/stats')
+def system_stats():
+    return ojson(collect_system_stats())
+
+
+@app.route('/api/system/processes')
+def get_top_processes():
+    return ojson(collect_top_processes())
+
+
+@app.route('/api/status')
+def combined_status():
+    """Everything the UI polls for, in one round trip."""
+    return ojson({
+        "scan": scan_state.status(),
+        "leftovers": leftover_state.status(),
+        "system": collect_system_stats(),
+        "processes": collect_top_processes()
+    })
+
+
+def find_free_port(preferred: int = 5050, attempts: int = 50) -> int:
+    """Return the first free port from `preferred` on, or one picked by the OS.
+
+    Binding is a purely local check. SO_REUSEADDR matches what the server
+    sets, so a port still in TIME_WAIT from a previous run counts as free.
+    """
+    for port in (*range(preferred, preferred + attempts), 0):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                s.bind(('127.0.0.1', port))
+            except OSError:
+                continue
+            return s.getsockname()[1]
+    raise RuntimeError("No free port available on 127.0.0.1")
 
 
 def open_browser(port):
-    time.sleep(1)
     webbrowser.open(f'http://127.0.0.1:{port}')
 
 
 if __name__ == '__main__':
-    # Find available port
-    port = 5050
-    while True:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            if s.connect_ex(('127.0.0.1', port)) != 0:
-                break
-            port += 1
+    port = find_free_port()
 
     print("\n" + "=" * 50)
     print("  Q-Cleaner Web Panel")
     print(f"  Open http://127.0.0.1:{port} in your browser")
     print("=" * 50 + "\n")
     
-    threading.Thread(target=open_browser, args=(port,), daemon=True).start()
-    app.run(host='127.0.0.1', port=port, debug=False)
+    # Give the server a head start so it is listening before the browser connects
+    browser_timer = threading.Timer(0.5, open_browser, args=(port,))
+    browser_timer.daemon = True
+    browser_timer.start()
+    if WAITRESS_AVAILABLE:
+        # Status, stats and process polls run side by side with scans and cleans
+        serve(app, host='127.0.0.1', port=port, threads=8, ident='qcleaner')
+    else:
+        app.run(host='127.0.0.1', port=port, debug=False, threaded=True)